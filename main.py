@@ -618,12 +618,14 @@ Examples:
                 report_level=args.reports,
             )
 
-            # Display completion summary
-            print("\n🎉 Evaluation Complete!")
-            print(f"📁 Report Location: {report_path}")
-            print(f"📊 Evaluation Mode: {args.mode.title()}")
-            print(f"🔬 Consensus Algorithm: {args.consensus.title()}")
-            print(f"📄 Report Level: {args.reports.title()}")
+            # Display completion summary in a single write
+            print(
+                "\n🎉 Evaluation Complete!\n"
+                f"📁 Report Location: {report_path}\n"
+                f"📊 Evaluation Mode: {args.mode.title()}\n"
+                f"🔬 Consensus Algorithm: {args.consensus.title()}\n"
+                f"📄 Report Level: {args.reports.title()}"
+            )
 
         except KeyboardInterrupt:
             print("\n⚠️  Evaluation interrupted by user")
@@ -639,8 +641,18 @@ Examples:
 
 def main():
     """Entry point for the CLI application."""
+    # Use uvloop's faster event loop for this run when it is installed
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        # uvloop not installed, continue with the default event loop
+        loop_factory = None
+
     cli = AccessibilityEvaluationCLI()
-    asyncio.run(cli.main())
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(cli.main())
 
 
 if __name__ == "__main__":
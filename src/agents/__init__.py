@@ -1,10 +1,39 @@
 """
 CrewAI agents for accessibility remediation plan evaluation.
 References: Master Plan - Agent Specifications, Phase 2 - Core Agents
+
+Agent classes are resolved lazily on first attribute access so that importing
+a single submodule (e.g. ``src.agents.tools.gap_analyzer``) does not pull in
+every agent module.
 """
 
-from .analysis_agent import AnalysisAgent
-from .judge_agent import PrimaryJudgeAgent, SecondaryJudgeAgent
-from .scoring_agent import ScoringAgent
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .analysis_agent import AnalysisAgent
+    from .judge_agent import PrimaryJudgeAgent, SecondaryJudgeAgent
+    from .scoring_agent import ScoringAgent
+
+_AGENT_MODULES = {
+    "PrimaryJudgeAgent": ".judge_agent",
+    "SecondaryJudgeAgent": ".judge_agent",
+    "ScoringAgent": ".scoring_agent",
+    "AnalysisAgent": ".analysis_agent",
+}
 
 __all__ = ["PrimaryJudgeAgent", "SecondaryJudgeAgent", "ScoringAgent", "AnalysisAgent"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the agent module that defines ``name`` on first access."""
+    if name not in _AGENT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include the lazily exported agent classes in ``dir()``."""
+    return sorted(set(globals()) | set(__all__))
@@ -3,21 +3,75 @@ Primary judge agent using Gemini Pro for accessibility evaluation.
 References: Master Plan - Agent Specifications, Phase 2 - Core Agents
 """
 
+import asyncio
 import logging
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from crewai import Agent, Task
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from ..config.llm_config import LLMManager
+from ..monitoring.performance_monitor import CacheManager
 from ..utils.llm_exceptions import LLMError, classify_llm_error
+from ..utils.timestamps import now_timestamp
+from .response_cache import ainvoke_cached, invoke_cached
+from .tools import shared_tool
 from .tools.evaluation_framework import EvaluationFrameworkTool
 from .tools.gap_analyzer import GapAnalyzerTool
 from .tools.scoring_calculator import ScoringCalculatorTool
 
 logger = logging.getLogger(__name__)
 
+# Evaluation prompts start with these plan-independent instructions and end
+# with the audit and plan text, so the shared prefix is identical for every
+# plan and can be served from provider-side prompt caches
+_PRIMARY_EVALUATION_INSTRUCTIONS = """
+As an expert accessibility consultant, evaluate the remediation plan given at the
+end of this prompt using the comprehensive framework established in
+promt/eval-prompt.md.
+
+EVALUATION REQUIREMENTS:
+1. Apply each weighted criterion systematically:
+   - Strategic Prioritization (40%): Risk-based sequencing, critical path analysis
+   - Technical Specificity (30%): Implementation detail, clarity, feasibility
+   - Comprehensiveness (20%): Coverage of audit findings, completeness
+   - Long-term Vision (10%): Sustainability, maintenance, scalability
+
+2. For each criterion, provide:
+   - Score (1-10 scale)
+   - Detailed reasoning (2-3 sentences minimum)
+   - Specific evidence from the plan
+   - Areas for improvement
+
+3. Calculate weighted final score
+4. Provide overall assessment with strengths and weaknesses
+5. Make specific recommendations for improvement
+"""
+
+_SECONDARY_EVALUATION_INSTRUCTIONS = """
+As an independent accessibility consultant, provide a thorough evaluation of the
+remediation plan given at the end of this prompt using the established framework
+from promt/eval-prompt.md.
+
+Your role is to offer an independent second opinion that validates or
+challenges assessments through rigorous analysis.
+
+INDEPENDENT EVALUATION REQUIREMENTS:
+1. Apply the same weighted criteria independently:
+   - Strategic Prioritization (40%)
+   - Technical Specificity (30%)
+   - Comprehensiveness (20%)
+   - Long-term Vision (10%)
+
+2. Provide your independent assessment with:
+   - Objective scoring and reasoning
+   - Alternative perspectives where applicable
+   - Validation or constructive challenge of other viewpoints
+   - Focus on aspects that may have been overlooked
+
+3. Offer recommendations that complement the overall evaluation
+"""
+
 
 class PrimaryJudgeAgent:
     """
@@ -31,18 +85,35 @@ class PrimaryJudgeAgent:
     - Long-term Vision (10%)
     """
 
-    def __init__(self, llm_manager: LLMManager):
+    def __init__(
+        self, llm_manager: LLMManager, cache_manager: Optional[CacheManager] = None
+    ):
         """
         Initialize the primary judge agent.
 
         Args:
             llm_manager: LLM configuration manager with Gemini Pro access
+            cache_manager: Optional cache for reusing LLM responses to identical
+                evaluation prompts
         """
         self.llm_manager = llm_manager
+        self.cache_manager = cache_manager
         self.llm = llm_manager.gemini
-        self.agent = self._create_agent()
+        self.agent = None  # Will be created when needed
         self.tools = self._initialize_tools()
 
+    @property
+    def agent(self):
+        """Get the agent with lazy initialization"""
+        if self._agent is None:
+            self._agent = self._create_agent()
+        return self._agent
+
+    @agent.setter
+    def agent(self, value):
+        """Set the agent"""
+        self._agent = value
+
     def _create_agent(self) -> Agent:
         """Create the primary judge agent with proper configuration"""
         return Agent(
@@ -81,9 +152,9 @@ class PrimaryJudgeAgent:
         """Initialize the tools used by this agent"""
         try:
             return [
-                EvaluationFrameworkTool(),
-                ScoringCalculatorTool(),
-                GapAnalyzerTool(),
+                shared_tool(EvaluationFrameworkTool),
+                shared_tool(ScoringCalculatorTool),
+                shared_tool(GapAnalyzerTool),
             ]
         except Exception as e:
             logger.warning(f"Some tools failed to initialize: {e}")
@@ -109,69 +180,93 @@ class PrimaryJudgeAgent:
             # Execute evaluation using the agent directly
             # Note: In CrewAI, tasks are typically executed by Crew, not individually
             # For now, we'll use the agent's LLM directly for evaluation
+            evaluation_prompt = self._build_evaluation_prompt(
+                plan_name, plan_content, audit_context
+            )
 
-            evaluation_prompt = f"""
-            As an expert accessibility consultant, evaluate {plan_name} using the
-            comprehensive framework established in promt/eval-prompt.md.
+            result_content = invoke_cached(
+                self.llm, self.cache_manager, evaluation_prompt, "primary_evaluation"
+            )
 
-            CONTEXT (Original Audit):
-            {audit_context[:2000]}...
+            logger.info(f"Primary judge completed evaluation of {plan_name}")
+            return self._build_evaluation_result(plan_name, result_content)
 
-            PLAN TO EVALUATE ({plan_name}):
-            {plan_content[:3000]}...
+        except Exception as e:
+            logger.error(f"Primary judge evaluation failed for {plan_name}: {e}")
+            return self._build_error_result(plan_name, e)
 
-            EVALUATION REQUIREMENTS:
-            1. Apply each weighted criterion systematically:
-               - Strategic Prioritization (40%): Risk-based sequencing, critical path analysis
-               - Technical Specificity (30%): Implementation detail, clarity, feasibility
-               - Comprehensiveness (20%): Coverage of audit findings, completeness
-               - Long-term Vision (10%): Sustainability, maintenance, scalability
-
-            2. For each criterion, provide:
-               - Score (1-10 scale)
-               - Detailed reasoning (2-3 sentences minimum)
-               - Specific evidence from the plan
-               - Areas for improvement
-
-            3. Calculate weighted final score
-            4. Provide overall assessment with strengths and weaknesses
-            5. Make specific recommendations for improvement
-            """
+    async def aevaluate_plan(
+        self, plan_name: str, plan_content: str, audit_context: str
+    ) -> Dict[str, Any]:
+        """
+        Async variant of evaluate_plan using ``llm.ainvoke``.
+
+        Args:
+            plan_name: Name of the plan (e.g., "PlanA")
+            plan_content: Full text content of the remediation plan
+            audit_context: Original accessibility audit report
 
-            result = self.llm.invoke(evaluation_prompt)
-            result_content = (
-                result.content if hasattr(result, "content") else str(result)
+        Returns:
+            Structured evaluation results
+        """
+        try:
+            logger.info(f"Primary judge evaluating {plan_name}")
+
+            evaluation_prompt = self._build_evaluation_prompt(
+                plan_name, plan_content, audit_context
             )
 
-            # Structure the response
-            evaluation_result = {
-                "plan_name": plan_name,
-                "evaluator": "Primary Judge (Gemini Pro)",
-                "evaluation_content": result_content,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "success": True,
-            }
+            result_content = await ainvoke_cached(
+                self.llm, self.cache_manager, evaluation_prompt, "primary_evaluation"
+            )
 
             logger.info(f"Primary judge completed evaluation of {plan_name}")
-            return evaluation_result
+            return self._build_evaluation_result(plan_name, result_content)
 
         except Exception as e:
             logger.error(f"Primary judge evaluation failed for {plan_name}: {e}")
+            return self._build_error_result(plan_name, e)
+
+    def _build_evaluation_prompt(
+        self, plan_name: str, plan_content: str, audit_context: str
+    ) -> str:
+        """Build the evaluation prompt with plan-specific text last"""
+        return f"""{_PRIMARY_EVALUATION_INSTRUCTIONS}
+            CONTEXT (Original Audit):
+            {audit_context[:2000]}...
+
+            PLAN TO EVALUATE ({plan_name}):
+            {plan_content[:3000]}...
+            """
+
+    def _build_evaluation_result(
+        self, plan_name: str, result_content: Any
+    ) -> Dict[str, Any]:
+        """Structure a successful evaluation response"""
+        return {
+            "plan_name": plan_name,
+            "evaluator": "Primary Judge (Gemini Pro)",
+            "evaluation_content": result_content,
+            "timestamp": now_timestamp(),
+            "success": True,
+        }
+
+    def _build_error_result(self, plan_name: str, error: Exception) -> Dict[str, Any]:
+        """Build the failure result for an evaluation"""
+        # Classify the error for better handling
+        llm_error = classify_llm_error(error, "Gemini Pro")
 
-            # Classify the error for better handling
-            llm_error = classify_llm_error(e, "Gemini Pro")
-
-            return {
-                "plan_name": plan_name,
-                "evaluator": "Primary Judge (Gemini Pro)",
-                "evaluation_content": f"Evaluation failed: {str(e)}",
-                "success": False,
-                "error": str(e),
-                "error_type": llm_error.__class__.__name__,
-                "retryable": llm_error.retryable,
-                "llm_type": "gemini",
-                "status": "failed",
-            }
+        return {
+            "plan_name": plan_name,
+            "evaluator": "Primary Judge (Gemini Pro)",
+            "evaluation_content": f"Evaluation failed: {str(error)}",
+            "success": False,
+            "error": str(error),
+            "error_type": llm_error.__class__.__name__,
+            "retryable": llm_error.retryable,
+            "llm_type": "gemini",
+            "status": "failed",
+        }
 
     def create_evaluation_task(
         self, plan_name: str, plan_content: str, audit_context: str
@@ -226,14 +321,19 @@ class SecondaryJudgeAgent:
     but with a different LLM to ensure objectivity and catch potential biases.
     """
 
-    def __init__(self, llm_manager: LLMManager):
+    def __init__(
+        self, llm_manager: LLMManager, cache_manager: Optional[CacheManager] = None
+    ):
         """
         Initialize the secondary judge agent.
 
         Args:
             llm_manager: LLM configuration manager with GPT-4 access
+            cache_manager: Optional cache for reusing LLM responses to identical
+                evaluation prompts
         """
         self.llm_manager = llm_manager
+        self.cache_manager = cache_manager
         self._llm = None  # Lazy initialization
         self.agent = None  # Will be created when needed
         self.tools = self._initialize_tools()
@@ -307,9 +407,9 @@ class SecondaryJudgeAgent:
         """Initialize the tools used by this agent"""
         try:
             return [
-                EvaluationFrameworkTool(),
-                ScoringCalculatorTool(),
-                GapAnalyzerTool(),
+                shared_tool(EvaluationFrameworkTool),
+                shared_tool(ScoringCalculatorTool),
+                shared_tool(GapAnalyzerTool),
             ]
         except Exception as e:
             logger.warning(f"Some tools failed to initialize for secondary judge: {e}")
@@ -337,72 +437,113 @@ class SecondaryJudgeAgent:
         try:
             logger.info(f"Secondary judge evaluating {plan_name}")
 
-            evaluation_prompt = f"""
-            As an independent accessibility consultant, provide a thorough evaluation
-            of {plan_name} using the established framework from promt/eval-prompt.md.
-
-            Your role is to offer an independent second opinion that validates or
-            challenges assessments through rigorous analysis.
+            evaluation_prompt = self._build_evaluation_prompt(
+                plan_name, plan_content, audit_context, primary_evaluation
+            )
 
-            CONTEXT (Original Audit):
-            {audit_context[:2000]}...
+            result_content = invoke_cached(
+                self.llm, self.cache_manager, evaluation_prompt, "secondary_evaluation"
+            )
 
-            PLAN TO EVALUATE ({plan_name}):
-            {plan_content[:3000]}...
+            logger.info(f"Secondary judge completed evaluation of {plan_name}")
+            return self._build_evaluation_result(
+                plan_name, result_content, primary_evaluation
+            )
 
-            {"PRIMARY EVALUATION FOR REFERENCE:" if primary_evaluation else ""}
-            {primary_evaluation[:1000] if primary_evaluation else ""}
+        except Exception as e:
+            logger.error(f"Secondary judge evaluation failed for {plan_name}: {e}")
+            return self._build_error_result(plan_name, e)
 
-            INDEPENDENT EVALUATION REQUIREMENTS:
-            1. Apply the same weighted criteria independently:
-               - Strategic Prioritization (40%)
-               - Technical Specificity (30%)
-               - Comprehensiveness (20%)
-               - Long-term Vision (10%)
+    async def aevaluate_plan(
+        self,
+        plan_name: str,
+        plan_content: str,
+        audit_context: str,
+        primary_evaluation: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of evaluate_plan using ``llm.ainvoke``.
 
-            2. Provide your independent assessment with:
-               - Objective scoring and reasoning
-               - Alternative perspectives where applicable
-               - Validation or constructive challenge of other viewpoints
-               - Focus on aspects that may have been overlooked
+        Args:
+            plan_name: Name of the plan (e.g., "PlanA")
+            plan_content: Full text content of the remediation plan
+            audit_context: Original accessibility audit report
+            primary_evaluation: Optional primary judge evaluation for comparison
 
-            3. Offer recommendations that complement the overall evaluation
-            """
+        Returns:
+            Structured evaluation results
+        """
+        try:
+            logger.info(f"Secondary judge evaluating {plan_name}")
 
-            result = self.llm.invoke(evaluation_prompt)
-            result_content = (
-                result.content if hasattr(result, "content") else str(result)
+            evaluation_prompt = self._build_evaluation_prompt(
+                plan_name, plan_content, audit_context, primary_evaluation
             )
 
-            evaluation_result = {
-                "plan_name": plan_name,
-                "evaluator": "Secondary Judge (GPT-4)",
-                "evaluation_content": result_content,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "success": True,
-                "includes_primary_comparison": primary_evaluation is not None,
-            }
+            result_content = await ainvoke_cached(
+                self.llm, self.cache_manager, evaluation_prompt, "secondary_evaluation"
+            )
 
             logger.info(f"Secondary judge completed evaluation of {plan_name}")
-            return evaluation_result
+            return self._build_evaluation_result(
+                plan_name, result_content, primary_evaluation
+            )
 
         except Exception as e:
             logger.error(f"Secondary judge evaluation failed for {plan_name}: {e}")
+            return self._build_error_result(plan_name, e)
 
-            # Classify the error for better handling
-            llm_error = classify_llm_error(e, "GPT-4")
-
-            return {
-                "plan_name": plan_name,
-                "evaluator": "Secondary Judge (GPT-4)",
-                "evaluation_content": f"Evaluation failed: {str(e)}",
-                "success": False,
-                "error": str(e),
-                "error_type": llm_error.__class__.__name__,
-                "retryable": llm_error.retryable,
-                "llm_type": "openai",
-                "status": "failed",
-            }
+    def _build_evaluation_prompt(
+        self,
+        plan_name: str,
+        plan_content: str,
+        audit_context: str,
+        primary_evaluation: Optional[str] = None,
+    ) -> str:
+        """Build the evaluation prompt with plan-specific text last"""
+        return f"""{_SECONDARY_EVALUATION_INSTRUCTIONS}
+            CONTEXT (Original Audit):
+            {audit_context[:2000]}...
+
+            PLAN TO EVALUATE ({plan_name}):
+            {plan_content[:3000]}...
+
+            {"PRIMARY EVALUATION FOR REFERENCE:" if primary_evaluation else ""}
+            {primary_evaluation[:1000] if primary_evaluation else ""}
+            """
+
+    def _build_evaluation_result(
+        self,
+        plan_name: str,
+        result_content: Any,
+        primary_evaluation: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Structure a successful evaluation response"""
+        return {
+            "plan_name": plan_name,
+            "evaluator": "Secondary Judge (GPT-4)",
+            "evaluation_content": result_content,
+            "timestamp": now_timestamp(),
+            "success": True,
+            "includes_primary_comparison": primary_evaluation is not None,
+        }
+
+    def _build_error_result(self, plan_name: str, error: Exception) -> Dict[str, Any]:
+        """Build the failure result for an evaluation"""
+        # Classify the error for better handling
+        llm_error = classify_llm_error(error, "GPT-4")
+
+        return {
+            "plan_name": plan_name,
+            "evaluator": "Secondary Judge (GPT-4)",
+            "evaluation_content": f"Evaluation failed: {str(error)}",
+            "success": False,
+            "error": str(error),
+            "error_type": llm_error.__class__.__name__,
+            "retryable": llm_error.retryable,
+            "llm_type": "openai",
+            "status": "failed",
+        }
 
     def get_agent_info(self) -> Dict[str, Any]:
         """Get information about this agent"""
@@ -418,3 +559,37 @@ class SecondaryJudgeAgent:
                 "Alternative perspective identification",
             ],
         }
+
+
+async def evaluate_plans_concurrently(
+    judges: List[Any],
+    remediation_plans: Dict[str, str],
+    audit_context: str,
+    max_concurrency: int = 4,
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate every plan with every judge, overlapping the LLM calls.
+
+    Args:
+        judges: Judge agents providing ``aevaluate_plan``
+        remediation_plans: Plan content keyed by plan name
+        audit_context: Original accessibility audit report
+        max_concurrency: Maximum number of evaluations in flight at once,
+            to stay within provider rate limits
+
+    Returns:
+        Evaluation results ordered by judge, then by plan
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _evaluate(judge: Any, plan_name: str, plan_content: str):
+        async with semaphore:
+            return await judge.aevaluate_plan(plan_name, plan_content, audit_context)
+
+    return await asyncio.gather(
+        *(
+            _evaluate(judge, plan_name, plan_content)
+            for judge in judges
+            for plan_name, plan_content in remediation_plans.items()
+        )
+    )
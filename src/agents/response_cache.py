@@ -0,0 +1,144 @@
+"""
+Shared LLM response caching for the evaluation agents.
+References: Phase 5 - Performance Optimization
+
+Agents accept an optional ``CacheManager``; when one is supplied, responses
+are keyed on the exact prompt text, the LLM's class, model and temperature,
+and the request type, so repeated evaluations of the same plan and audit
+skip the LLM call entirely. Uncached calls are timed at debug level so LLM
+latency can be compared with the local processing around it.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Tuple
+
+from ..monitoring.performance_monitor import CacheManager
+
+logger = logging.getLogger(__name__)
+
+
+def _llm_identity(llm: Any) -> str:
+    """Describe the LLM configuration a response depends on, for cache keys"""
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", "")
+    temperature = getattr(llm, "temperature", None)
+    return f"{type(llm).__name__}|{model}|{temperature}"
+
+
+def lookup_cached_response(
+    cache_manager: Optional[CacheManager], prompt: str, llm: Any, request_type: str
+) -> Tuple[Optional[str], Any]:
+    """
+    Return the cache key and any cached response for a prompt.
+
+    Args:
+        cache_manager: Cache to consult, or None when caching is disabled
+        prompt: Fully formatted prompt text
+        llm: LLM the prompt would be sent to
+        request_type: Kind of request, used to namespace the cache key
+
+    Returns:
+        Tuple of (cache key, cached content); both are None when caching is
+        disabled, and the content is None on a cache miss
+    """
+    if cache_manager is None:
+        return None, None
+
+    cache_key = cache_manager.get_cache_key(prompt, _llm_identity(llm), request_type)
+    cached_content = cache_manager.get_cached_result(cache_key)
+    if cached_content is not None:
+        logger.info(f"Reusing cached LLM response for {request_type}")
+    return cache_key, cached_content
+
+
+def store_response(
+    cache_manager: Optional[CacheManager], cache_key: Optional[str], result: Any
+) -> Any:
+    """
+    Extract the content of an LLM response and cache it if enabled.
+
+    Args:
+        cache_manager: Cache to store into, or None when caching is disabled
+        cache_key: Key returned by ``lookup_cached_response``
+        result: Raw LLM response
+
+    Returns:
+        Response content
+    """
+    result_content = result.content if hasattr(result, "content") else str(result)
+    if cache_manager is not None and cache_key is not None:
+        cache_manager.cache_result(
+            cache_key,
+            result_content,
+            size_estimate_mb=len(str(result_content).encode()) / (1024 * 1024),
+        )
+    return result_content
+
+
+@contextmanager
+def log_llm_latency(request_type: str) -> Iterator[None]:
+    """
+    Log the wall-clock time of the LLM call made inside the block.
+
+    Args:
+        request_type: Kind of request, included in the log message
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.debug(f"LLM call for {request_type} took {elapsed_ms:.0f}ms")
+
+
+def invoke_cached(
+    llm: Any, cache_manager: Optional[CacheManager], prompt: str, request_type: str
+) -> Any:
+    """
+    Invoke the LLM, reusing the cached response for an identical prompt.
+
+    Args:
+        llm: LLM to send the prompt to on a cache miss
+        cache_manager: Cache to consult, or None when caching is disabled
+        prompt: Fully formatted prompt text
+        request_type: Kind of request, used to namespace the cache key
+
+    Returns:
+        Response content from the LLM or the cache
+    """
+    cache_key, cached_content = lookup_cached_response(
+        cache_manager, prompt, llm, request_type
+    )
+    if cached_content is not None:
+        return cached_content
+
+    with log_llm_latency(request_type):
+        result = llm.invoke(prompt)
+    return store_response(cache_manager, cache_key, result)
+
+
+async def ainvoke_cached(
+    llm: Any, cache_manager: Optional[CacheManager], prompt: str, request_type: str
+) -> Any:
+    """
+    Async variant of invoke_cached using ``llm.ainvoke``.
+
+    Args:
+        llm: LLM to send the prompt to on a cache miss
+        cache_manager: Cache to consult, or None when caching is disabled
+        prompt: Fully formatted prompt text
+        request_type: Kind of request, used to namespace the cache key
+
+    Returns:
+        Response content from the LLM or the cache
+    """
+    cache_key, cached_content = lookup_cached_response(
+        cache_manager, prompt, llm, request_type
+    )
+    if cached_content is not None:
+        return cached_content
+
+    with log_llm_latency(request_type):
+        result = await llm.ainvoke(prompt)
+    return store_response(cache_manager, cache_key, result)
@@ -4,19 +4,61 @@ References: Master Plan - Agent Specifications, Phase 2 - Scoring System
 """
 
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Tuple
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from crewai import Agent
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from ..config.llm_config import LLMManager
+from ..monitoring.performance_monitor import CacheManager
 from ..utils.llm_exceptions import LLMError, classify_llm_error
+from ..utils.timestamps import now_timestamp
+from .response_cache import invoke_cached
+from .tools import shared_tool
 from .tools.plan_comparator import PlanComparatorTool
 from .tools.scoring_calculator import ScoringCalculatorTool
 
 logger = logging.getLogger(__name__)
 
+# Plan-independent instructions lead the scoring prompt so the shared prefix
+# can be served from provider-side prompt caches; evaluation data goes last
+_SCORING_ANALYSIS_INSTRUCTIONS = """
+As a scoring specialist, provide comprehensive analysis of the remediation plan
+evaluations given at the end of this prompt and generate final rankings with
+detailed insights.
+
+ANALYSIS REQUIREMENTS:
+1. Validate the scoring methodology and calculations
+2. Provide final rankings with confidence levels
+3. Identify any scoring anomalies or concerns
+4. Generate strategic recommendations based on scores
+5. Account for organizational decision factors beyond scores
+6. Provide implementation risk assessment for top-ranked plans
+
+Output a comprehensive scoring report with clear recommendations.
+"""
+
+# Criterion keywords searched for in judge output, and the score that follows
+_CRITERIA_KEYWORDS = {
+    "strategic": "Strategic Prioritization",
+    "technical": "Technical Specificity",
+    "comprehensive": "Comprehensiveness",
+    "vision": "Long-term Vision",
+}
+_SCORE_NUMBER_RE = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+
+# Criterion weights from promt/eval-prompt.md, used when none are supplied
+DEFAULT_CRITERIA_WEIGHTS: Mapping[str, float] = MappingProxyType(
+    {
+        "Strategic Prioritization": 0.4,
+        "Technical Specificity": 0.3,
+        "Comprehensiveness": 0.2,
+        "Long-term Vision": 0.1,
+    }
+)
+
 
 class ScoringAgent:
     """
@@ -29,18 +71,35 @@ class ScoringAgent:
     - Recommendation synthesis
     """
 
-    def __init__(self, llm_manager: LLMManager):
+    def __init__(
+        self, llm_manager: LLMManager, cache_manager: Optional[CacheManager] = None
+    ):
         """
         Initialize the scoring agent.
 
         Args:
             llm_manager: LLM configuration manager
+            cache_manager: Optional cache for reusing LLM responses to identical
+                scoring and comparison prompts
         """
         self.llm_manager = llm_manager
+        self.cache_manager = cache_manager
         self.llm = llm_manager.gemini  # Use Gemini for scoring consistency
-        self.agent = self._create_agent()
+        self.agent = None  # Will be created when needed
         self.tools = self._initialize_tools()
 
+    @property
+    def agent(self):
+        """Get the agent with lazy initialization"""
+        if self._agent is None:
+            self._agent = self._create_agent()
+        return self._agent
+
+    @agent.setter
+    def agent(self, value):
+        """Set the agent"""
+        self._agent = value
+
     def _create_agent(self) -> Agent:
         """Create the scoring agent with proper configuration"""
         return Agent(
@@ -71,20 +130,23 @@ class ScoringAgent:
     def _initialize_tools(self) -> List:
         """Initialize the tools used by this agent"""
         try:
-            return [ScoringCalculatorTool(), PlanComparatorTool()]
+            return [shared_tool(ScoringCalculatorTool), shared_tool(PlanComparatorTool)]
         except Exception as e:
             logger.warning(f"Some tools failed to initialize for scoring agent: {e}")
             return []
 
     def calculate_final_scores(
-        self, evaluations: List[Dict[str, Any]], criteria_weights: Dict[str, float]
+        self,
+        evaluations: List[Dict[str, Any]],
+        criteria_weights: Mapping[str, float] = DEFAULT_CRITERIA_WEIGHTS,
     ) -> Dict[str, Any]:
         """
         Calculate final weighted scores for all evaluated plans.
 
         Args:
             evaluations: List of evaluation results from judge agents
-            criteria_weights: Dictionary of criteria names to weights
+            criteria_weights: Mapping of criteria names to weights; defaults to
+                the evaluation framework weights
 
         Returns:
             Comprehensive scoring analysis with rankings
@@ -105,39 +167,25 @@ class ScoringAgent:
                     weighted_scores[plan_name] = weighted_score
 
             # Generate comprehensive scoring analysis
-            scoring_prompt = f"""
-            As a scoring specialist, provide comprehensive analysis of the remediation plan
-            evaluations and generate final rankings with detailed insights.
-
+            scoring_prompt = f"""{_SCORING_ANALYSIS_INSTRUCTIONS}
             EVALUATION DATA:
             {self._format_evaluations_for_analysis(evaluations)}
 
             CALCULATED SCORES:
             {self._format_scores_for_analysis(weighted_scores)}
-
-            ANALYSIS REQUIREMENTS:
-            1. Validate the scoring methodology and calculations
-            2. Provide final rankings with confidence levels
-            3. Identify any scoring anomalies or concerns
-            4. Generate strategic recommendations based on scores
-            5. Account for organizational decision factors beyond scores
-            6. Provide implementation risk assessment for top-ranked plans
-
-            Output a comprehensive scoring report with clear recommendations.
             """
 
-            result = self.llm.invoke(scoring_prompt)
-            result_content = (
-                result.content if hasattr(result, "content") else str(result)
+            result_content = invoke_cached(
+                self.llm, self.cache_manager, scoring_prompt, "scoring_analysis"
             )
 
             scoring_analysis = {
                 "scoring_method": "Weighted Multi-Criteria Analysis",
-                "criteria_weights": criteria_weights,
+                "criteria_weights": dict(criteria_weights),
                 "plan_scores": weighted_scores,
                 "rankings": self._generate_rankings(weighted_scores),
                 "analysis_content": result_content,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": now_timestamp(),
                 "evaluations_processed": len(evaluations),
                 "success": True,
             }
@@ -157,7 +205,7 @@ class ScoringAgent:
                 "retryable": llm_error.retryable,
                 "llm_type": "gemini",
                 "success": False,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": now_timestamp(),
             }
 
     def compare_plans(
@@ -204,16 +252,15 @@ class ScoringAgent:
             Provide actionable insights for decision makers.
             """
 
-            result = self.llm.invoke(comparison_prompt)
-            result_content = (
-                result.content if hasattr(result, "content") else str(result)
+            result_content = invoke_cached(
+                self.llm, self.cache_manager, comparison_prompt, "plan_comparison"
             )
 
             comparison_result = {
                 "plan_a": plan_a["name"],
                 "plan_b": plan_b["name"],
                 "comparison_analysis": result_content,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": now_timestamp(),
                 "success": True,
             }
 
@@ -234,7 +281,7 @@ class ScoringAgent:
                 "retryable": llm_error.retryable,
                 "llm_type": "gemini",
                 "success": False,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": now_timestamp(),
             }
 
     def _extract_scores_from_evaluations(
@@ -257,28 +304,24 @@ class ScoringAgent:
 
     def _parse_scores_from_text(self, text: str) -> Dict[str, float]:
         """Parse scores from evaluation text - simplified implementation"""
-        import re
-
         scores = {}
-        criteria_map = {
-            "strategic": "Strategic Prioritization",
-            "technical": "Technical Specificity",
-            "comprehensive": "Comprehensiveness",
-            "vision": "Long-term Vision",
-        }
+        lowered = text.lower()
 
         # Look for score patterns like "Strategic: 8/10" or "Technical Specificity: 7.5"
-        for key, criterion in criteria_map.items():
-            pattern = rf"{key}[^0-9]*([0-9]+(?:\.[0-9]+)?)"
-            match = re.search(pattern, text.lower())
+        # by taking the first number after the first mention of each criterion
+        for key, criterion in _CRITERIA_KEYWORDS.items():
+            start = lowered.find(key)
+            if start == -1:
+                continue
+            match = _SCORE_NUMBER_RE.search(lowered, start + len(key))
             if match:
-                score = float(match.group(1))
+                score = float(match.group(0))
                 scores[criterion] = min(score, 10.0)  # Cap at 10
 
         return scores
 
     def _calculate_weighted_score(
-        self, scores: Dict[str, float], weights: Dict[str, float]
+        self, scores: Dict[str, float], weights: Mapping[str, float]
     ) -> float:
         """Calculate weighted average score"""
         total_weighted = 0.0
@@ -301,29 +344,24 @@ class ScoringAgent:
     def _format_evaluations_for_analysis(
         self, evaluations: List[Dict[str, Any]]
     ) -> str:
-        """Format evaluations for LLM analysis"""
-        formatted = []
-        for eval_data in evaluations:
-            if eval_data.get("success"):
-                formatted.append(
-                    f"""
-                Plan: {eval_data.get('plan_name', 'Unknown')}
-                Evaluator: {eval_data.get('evaluator', 'Unknown')}
-                Content: {eval_data.get('evaluation_content', '')[:500]}...
-                """
-                )
-        return "\n".join(formatted)
+        """Format evaluations for LLM analysis as compact, unindented entries"""
+        return "\n".join(
+            f"Plan: {eval_data.get('plan_name', 'Unknown')} | "
+            f"Evaluator: {eval_data.get('evaluator', 'Unknown')} | "
+            f"Content: {(eval_data.get('evaluation_content') or '')[:500]}..."
+            for eval_data in evaluations
+            if eval_data.get("success")
+        )
 
     def _format_scores_for_analysis(self, scores: Dict[str, float]) -> str:
         """Format scores for LLM analysis"""
         if not scores:
             return "No valid scores calculated"
 
-        formatted = []
-        for plan, score in sorted(scores.items(), key=lambda x: x[1], reverse=True):
-            formatted.append(f"{plan}: {score:.2f}/10")
-
-        return "\n".join(formatted)
+        return "\n".join(
+            f"{plan}: {score:.2f}/10"
+            for plan, score in sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        )
 
     def get_agent_info(self) -> Dict[str, Any]:
         """Get information about this agent"""
@@ -3,6 +3,9 @@ CrewAI tools for accessibility evaluation agents.
 References: Master Plan - Agent Tools, Phase 2 - Tool Implementation
 """
 
+from functools import lru_cache
+from typing import Type, TypeVar
+
 from .evaluation_framework import EvaluationFrameworkTool
 from .gap_analyzer import GapAnalyzerTool
 from .plan_comparator import PlanComparatorTool
@@ -13,4 +16,25 @@ __all__ = [
     "ScoringCalculatorTool",
     "GapAnalyzerTool",
     "PlanComparatorTool",
+    "shared_tool",
 ]
+
+ToolT = TypeVar("ToolT")
+
+
+@lru_cache(maxsize=None)
+def shared_tool(tool_cls: Type[ToolT]) -> ToolT:
+    """
+    Return a process-wide instance of a tool class.
+
+    The tools keep no per-run state after construction, so every agent can
+    share one instance instead of repeating the setup work (such as loading
+    promt/eval-prompt.md) for each agent.
+
+    Args:
+        tool_cls: Tool class to instantiate
+
+    Returns:
+        The shared instance of ``tool_cls``
+    """
+    return tool_cls()
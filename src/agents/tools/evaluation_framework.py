@@ -4,6 +4,7 @@ References: Master Plan - Evaluation Framework, promt/eval-prompt.md
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -15,6 +16,17 @@ from ...tools.prompt_manager import PromptManager
 
 logger = logging.getLogger(__name__)
 
+# Evaluation prompt the framework criteria are read from
+_EVAL_PROMPT_PATH = (
+    Path(__file__).parent.parent.parent.parent / "promt" / "eval-prompt.md"
+)
+
+
+@lru_cache(maxsize=4)
+def _load_criteria(prompt_path: str) -> Dict[str, float]:
+    """Read and parse the criteria weights from a prompt file, once per path"""
+    return PromptManager(Path(prompt_path)).extract_evaluation_criteria()
+
 
 class EvaluationFrameworkInput(BaseModel):
     """Input model for evaluation framework tool"""
@@ -56,18 +68,19 @@ class EvaluationFrameworkTool(BaseTool):
             This tool evaluates plans against the 4 weighted criteria established in
             the evaluation framework and provides structured scoring.""",
         )
-        # Get the path to the evaluation prompt
-        prompt_path = (
-            Path(__file__).parent.parent.parent.parent / "promt" / "eval-prompt.md"
-        )
         # Store everything as private attributes to avoid Pydantic field issues
-        self.__prompt_manager = PromptManager(prompt_path)
         self.__criteria_weights = self._load_evaluation_framework()
+        # The criteria lines are the same in every prompt, so format them once
+        self.__criteria_text = "\n".join(
+            f"- {criterion_name} ({weight * 100:.0f}%)"
+            for criterion_name, weight in self.__criteria_weights.items()
+        )
 
     def _load_evaluation_framework(self) -> Dict[str, float]:
         """Load the evaluation framework from promt/eval-prompt.md"""
         try:
-            criteria_weights = self.__prompt_manager.extract_evaluation_criteria()
+            # Copy the cached criteria so instances cannot alter each other's
+            criteria_weights = dict(_load_criteria(str(_EVAL_PROMPT_PATH)))
             logger.info(
                 f"Loaded evaluation framework with {len(criteria_weights)} criteria"
             )
@@ -110,6 +123,7 @@ class EvaluationFrameworkTool(BaseTool):
                 "plan_content": plan_content,
                 "audit_context": audit_context,
                 "criteria": self.criteria_weights,
+                "criteria_text": self.__criteria_text,
             }
 
             # Generate structured evaluation prompt
@@ -127,20 +141,13 @@ class EvaluationFrameworkTool(BaseTool):
     def _build_evaluation_prompt(self, context: Dict[str, Any]) -> str:
         """Build structured evaluation prompt for the agent"""
 
-        criteria_text = "\n".join(
-            [
-                f"- {criterion_name} ({weight * 100:.0f}%)"
-                for criterion_name, weight in context["criteria"].items()
-            ]
-        )
-
         prompt = f"""
 EVALUATION FRAMEWORK ASSESSMENT
 
 Plan: {context['plan_name']}
 
 EVALUATION CRITERIA (apply each with specified weight):
-{criteria_text}
+{context['criteria_text']}
 
 ORIGINAL AUDIT CONTEXT:
 {context['audit_context'][:2000]}...
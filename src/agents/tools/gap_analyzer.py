@@ -4,13 +4,33 @@ References: Master Plan - Gap Analysis, Phase 2 - Comprehensive Evaluation
 """
 
 import logging
-from typing import Any, Dict, List, Set
+import re
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, FrozenSet, List, Set
 
 from crewai_tools.tools.base_tool import BaseTool
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Key accessibility areas checked for in both the audit and the plan
+_ACCESSIBILITY_KEYWORDS = frozenset(
+    ["keyboard", "contrast", "alt text", "headings", "focus"]
+)
+
+# Audit lines containing any common issue indicator
+_ISSUE_LINE_RE = re.compile(
+    r"^.*(?:violation|error|fail|missing|incorrect|inaccessible|non-compliant"
+    r"|issue|problem).*$",
+    re.MULTILINE,
+)
+
+# Common words ignored when extracting key terms from audit findings
+_STOP_WORDS = frozenset(
+    ["the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"]
+)
+
 
 class GapAnalysisInput(BaseModel):
     """Input model for gap analysis tool"""
@@ -74,6 +94,29 @@ class GapAnalyzerTool(BaseTool):
             },
         )
 
+        # Keyword sets are built once so each document is scanned for every
+        # distinct keyword a single time and criteria checks are set lookups
+        object.__setattr__(
+            self,
+            "_wcag_keyword_sets",
+            {
+                criterion: frozenset(keywords)
+                for criterion, keywords in self.wcag_criteria.items()
+            },
+        )
+        object.__setattr__(
+            self,
+            "_all_keywords",
+            _ACCESSIBILITY_KEYWORDS.union(*self._wcag_keyword_sets.values()),
+        )
+
+    def _match_keywords(self, text: str) -> FrozenSet[str]:
+        """Return the analysis keywords that occur in text, ignoring case"""
+        text_lower = text.lower()
+        return frozenset(
+            keyword for keyword in self._all_keywords if keyword in text_lower
+        )
+
     def _run(self, plan_content: str, audit_content: str, plan_name: str) -> str:
         """
         Analyze gaps in remediation plan coverage.
@@ -90,36 +133,24 @@ class GapAnalyzerTool(BaseTool):
             logger.info(f"Analyzing gaps for {plan_name}")
 
             # Simplified gap analysis for validation
-            plan_lower = plan_content.lower()
-            audit_lower = audit_content.lower()
-
-            # Basic coverage assessment
-            covered_issues = 0
+            plan_hits = self._match_keywords(plan_content)
+            audit_hits = self._match_keywords(audit_content)
 
             # Simple keyword matching for demo purposes
-            accessibility_keywords = [
-                "keyboard",
-                "contrast",
-                "alt text",
-                "headings",
-                "focus",
-            ]
-            for keyword in accessibility_keywords:
-                if keyword in audit_lower and keyword in plan_lower:
-                    covered_issues += 1
-
-            coverage_percentage = (covered_issues / len(accessibility_keywords)) * 100
+            covered_issues = len(_ACCESSIBILITY_KEYWORDS & audit_hits & plan_hits)
+
+            coverage_percentage = (covered_issues / len(_ACCESSIBILITY_KEYWORDS)) * 100
 
             # Generate gap analysis report
             gap_report = f"""GAP ANALYSIS REPORT for {plan_name}
 =============================================
 
 COVERAGE SUMMARY:
-- Issues Addressed: {covered_issues}/{len(accessibility_keywords)} accessibility areas
+- Issues Addressed: {covered_issues}/{len(_ACCESSIBILITY_KEYWORDS)} accessibility areas
 - Coverage Percentage: {coverage_percentage:.1f}%
 
 ANALYSIS:
-The plan addresses {covered_issues} out of {len(accessibility_keywords)} key accessibility areas identified in the audit.
+The plan addresses {covered_issues} out of {len(_ACCESSIBILITY_KEYWORDS)} key accessibility areas identified in the audit.
 
 RECOMMENDATIONS:
 {"Good coverage of accessibility requirements." if coverage_percentage > 60 else "Consider addressing additional accessibility requirements."}
@@ -133,35 +164,24 @@ RECOMMENDATIONS:
 
     def _extract_audit_issues(self, audit_content: str) -> List[str]:
         """Extract key accessibility issues from audit report"""
-        issues = []
-
         # Look for common issue indicators
-        issue_keywords = [
-            "violation",
-            "error",
-            "fail",
-            "missing",
-            "incorrect",
-            "inaccessible",
-            "non-compliant",
-            "issue",
-            "problem",
-        ]
+        issue_lines = (
+            match.group(0).strip()
+            for match in _ISSUE_LINE_RE.finditer(audit_content.lower())
+        )
 
-        lines = audit_content.lower().split("\n")
-        for line in lines:
-            if any(keyword in line for keyword in issue_keywords):
-                # Clean and extract meaningful issue descriptions
-                if len(line.strip()) > 20:  # Avoid short/incomplete lines
-                    issues.append(line.strip())
+        # Clean and extract meaningful issue descriptions, avoiding short lines
+        issues = (line for line in issue_lines if len(line) > 20)
 
-        return issues[:20]  # Limit to most relevant issues
+        return list(islice(issues, 20))  # Limit to most relevant issues
 
     def _analyze_audit_coverage(
         self, plan_content: str, audit_content: str
     ) -> Dict[str, Any]:
         """Analyze how well the plan covers audit findings"""
         plan_lower = plan_content.lower()
+        # Audit findings repeat terms, so each distinct term is searched for once
+        term_in_plan = lru_cache(maxsize=None)(plan_lower.__contains__)
         audit_lines = [
             line.strip() for line in audit_content.split("\n") if line.strip()
         ]
@@ -184,7 +204,7 @@ RECOMMENDATIONS:
             issue_terms = self._extract_key_terms(issue)
 
             # Check if any terms appear in the plan
-            term_matches = sum(1 for term in issue_terms if term in plan_lower)
+            term_matches = sum(1 for term in issue_terms if term_in_plan(term))
 
             if term_matches >= len(issue_terms) * 0.7:  # 70% of terms match
                 coverage_stats["addressed_issues"] += 1
@@ -207,37 +227,26 @@ RECOMMENDATIONS:
     def _extract_key_terms(self, text: str) -> List[str]:
         """Extract key terms from issue description"""
         # Remove common words and extract meaningful terms
-        stop_words = {
-            "the",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-        }
         words = text.lower().split()
-        key_terms = [word for word in words if len(word) > 3 and word not in stop_words]
+        key_terms = [
+            word for word in words if len(word) > 3 and word not in _STOP_WORDS
+        ]
         return key_terms[:5]  # Limit to most relevant terms
 
     def _identify_wcag_gaps(
         self, plan_content: str, audit_content: str
     ) -> Dict[str, List[str]]:
         """Identify WCAG criteria that may be missing from the plan"""
-        plan_lower = plan_content.lower()
-        audit_lower = audit_content.lower()
+        plan_hits = self._match_keywords(plan_content)
+        audit_hits = self._match_keywords(audit_content)
         gaps = {}
 
         for criterion, keywords in self.wcag_criteria.items():
+            keyword_set = self._wcag_keyword_sets[criterion]
             # Check if audit mentions this criterion area
-            audit_mentions = any(keyword in audit_lower for keyword in keywords)
+            audit_mentions = not keyword_set.isdisjoint(audit_hits)
             # Check if plan addresses this criterion area
-            plan_addresses = any(keyword in plan_lower for keyword in keywords)
+            plan_addresses = not keyword_set.isdisjoint(plan_hits)
 
             if audit_mentions and not plan_addresses:
                 gaps[criterion] = keywords
@@ -6,7 +6,8 @@ Phase 5: Advanced Features & Optimization - Batch Processing
 """
 
 import asyncio
-import json
+import csv
+import io
 import statistics
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
@@ -14,6 +15,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..utils.json_encoding import dumps_json_bytes
+
 
 @dataclass
 class BatchJob:
@@ -92,24 +95,33 @@ class BatchProcessor:
 
         try:
             batch_results = {}
+            combinations = []
+            # Bound in-flight evaluations so large batches don't fire every
+            # crew call at once
+            semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
 
-            # Process each audit report with its corresponding plan sets
+            # Pair each audit report with its corresponding plan set
             for i, audit_path in enumerate(job.audit_reports):
-                audit_name = audit_path.stem
-
                 # Get corresponding plan directory
                 plan_dir = (
                     job.plan_directories[i]
                     if i < len(job.plan_directories)
                     else job.plan_directories[0]
                 )
-
-                # Process this audit/plan combination
-                evaluation_result = await self._process_audit_plan_combination(
-                    audit_path, plan_dir, f"{audit_name}_{i}"
+                combinations.append(
+                    self._process_limited_combination(
+                        semaphore, audit_path, plan_dir, f"{audit_path.stem}_{i}"
+                    )
                 )
 
-                batch_results[audit_name] = evaluation_result
+            # Combinations are independent, so evaluate them concurrently
+            # up to the processor's concurrency limit
+            evaluation_results = await asyncio.gather(*combinations)
+
+            for audit_path, evaluation_result in zip(
+                job.audit_reports, evaluation_results
+            ):
+                batch_results[audit_path.stem] = evaluation_result
 
             # Generate batch summary
             batch_summary = self._generate_batch_summary(batch_results)
@@ -194,34 +206,40 @@ class BatchProcessor:
         all_plan_scores: Dict[str, List[float]] = {}
 
         for audit_name, result in batch_results.items():
-            if hasattr(result, "plan_scores"):
-                for plan_name, score in result.plan_scores.items():
-                    if plan_name not in all_plan_scores:
-                        all_plan_scores[plan_name] = []
-                    all_plan_scores[plan_name].append(score)
-
-        # Calculate average scores per plan across all audits
+            for plan_name, score in self._get_plan_scores(result).items():
+                if plan_name not in all_plan_scores:
+                    all_plan_scores[plan_name] = []
+                all_plan_scores[plan_name].append(score)
+
+        # Calculate average scores per plan across all audits, tracking the
+        # best performing plan as we go
+        best_plan: Optional[str] = None
+        best_mean = 0.0
         for plan_name, scores in all_plan_scores.items():
+            mean = sum(scores) / len(scores)
             summary["average_scores"][plan_name] = {
-                "mean": sum(scores) / len(scores),
+                "mean": mean,
                 "min": min(scores),
                 "max": max(scores),
                 "std_dev": self._calculate_std_dev(scores),
             }
+            if best_plan is None or mean > best_mean:
+                best_plan, best_mean = plan_name, mean
 
         # Identify best performing plans
-        if summary["average_scores"]:
-            best_plan = max(
-                summary["average_scores"].items(), key=lambda x: x[1]["mean"]
-            )
+        if best_plan is not None:
             summary["best_performing_plans"]["overall"] = {
-                "plan": best_plan[0],
-                "average_score": best_plan[1]["mean"],
+                "plan": best_plan,
+                "average_score": best_mean,
             }
 
         # Calculate consistency metrics
         summary["consistency_metrics"] = self._calculate_consistency_metrics(
-            all_plan_scores
+            all_plan_scores,
+            std_devs={
+                plan_name: stats["std_dev"]
+                for plan_name, stats in summary["average_scores"].items()
+            },
         )
 
         # Generate recommendations
@@ -233,16 +251,49 @@ class BatchProcessor:
 
     def export_batch_results(self, job_id: str, format: str = "json") -> str:
         """Export batch results in specified format"""
+        return self._encode_results(self._get_completed_results(job_id), format)
+
+    def export_batch_results_multi(
+        self, job_id: str, formats: List[str]
+    ) -> Dict[str, str]:
+        """
+        Export batch results in several formats at once
+
+        The job lookup happens once and each encoder runs on the processor's
+        thread pool, so the exports overlap instead of running back to back.
+
+        Args:
+            job_id: Completed batch job to export
+            formats: Export formats to produce (json, csv, markdown)
+
+        Returns:
+            Dictionary mapping each requested format to its encoded output
+        """
+        results = self._get_completed_results(job_id)
+
+        futures = {
+            format: self.executor.submit(self._encode_results, results, format)
+            for format in formats
+        }
+
+        return {format: future.result() for format, future in futures.items()}
+
+    def _get_completed_results(self, job_id: str) -> Dict[str, Any]:
+        """Look up the results of a completed job"""
         job = self.completed_jobs.get(job_id)
         if not job or not job.results:
             raise ValueError(f"No completed results found for job {job_id}")
 
+        return job.results
+
+    def _encode_results(self, results: Dict[str, Any], format: str) -> str:
+        """Encode batch results in the specified format"""
         if format.lower() == "json":
-            return json.dumps(job.results, indent=2, default=str)
+            return dumps_json_bytes(results).decode()
         elif format.lower() == "csv":
-            return self._export_to_csv(job.results)
+            return self._export_to_csv(results)
         elif format.lower() == "markdown":
-            return self._export_to_markdown(job.results)
+            return self._export_to_markdown(results)
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
@@ -251,6 +302,19 @@ class BatchProcessor:
         # Simplified implementation for now
         pass
 
+    async def _process_limited_combination(
+        self,
+        semaphore: asyncio.Semaphore,
+        audit_path: Path,
+        plan_dir: Path,
+        session_id: str,
+    ):
+        """Process an audit/plan combination once a concurrency slot is free"""
+        async with semaphore:
+            return await self._process_audit_plan_combination(
+                audit_path, plan_dir, session_id
+            )
+
     async def _process_audit_plan_combination(
         self, audit_path: Path, plan_dir: Path, session_id: str
     ):
@@ -264,6 +328,12 @@ class BatchProcessor:
             "plan_directory": str(plan_dir),
         }
 
+    def _get_plan_scores(self, result: Any) -> Dict[str, float]:
+        """Read plan scores from a combination result dict or result object"""
+        if isinstance(result, dict):
+            return result.get("plan_scores", {})
+        return getattr(result, "plan_scores", {})
+
     def _calculate_std_dev(self, scores: List[float]) -> float:
         """Calculate standard deviation of scores"""
         if len(scores) <= 1:
@@ -271,16 +341,30 @@ class BatchProcessor:
         return statistics.stdev(scores)
 
     def _calculate_consistency_metrics(
-        self, all_plan_scores: Dict[str, List[float]]
+        self,
+        all_plan_scores: Dict[str, List[float]],
+        std_devs: Optional[Dict[str, float]] = None,
     ) -> Dict[str, float]:
-        """Calculate consistency metrics across evaluations"""
+        """
+        Calculate consistency metrics across evaluations
+
+        Args:
+            all_plan_scores: Scores per plan across all evaluations
+            std_devs: Already computed standard deviation per plan, if any
+
+        Returns:
+            Consistency metric per plan
+        """
         metrics = {}
 
         for plan_name, scores in all_plan_scores.items():
             if len(scores) > 1:
-                metrics[f"{plan_name}_consistency"] = 1.0 / (
-                    1.0 + self._calculate_std_dev(scores)
+                std_dev = (
+                    std_devs[plan_name]
+                    if std_devs is not None
+                    else self._calculate_std_dev(scores)
                 )
+                metrics[f"{plan_name}_consistency"] = 1.0 / (1.0 + std_dev)
             else:
                 metrics[f"{plan_name}_consistency"] = 1.0
 
@@ -307,16 +391,19 @@ class BatchProcessor:
 
     def _export_to_csv(self, results: Dict[str, Any]) -> str:
         """Export results to CSV format"""
-        # Simplified CSV export implementation
-        csv_lines = ["Plan,Score,Audit"]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(("Plan", "Score", "Audit"))
 
+        # Stream every row through the C csv writer in one call
         individual_results = results.get("individual_results", {})
-        for audit_name, audit_result in individual_results.items():
-            if hasattr(audit_result, "plan_scores"):
-                for plan_name, score in audit_result.plan_scores.items():
-                    csv_lines.append(f"{plan_name},{score},{audit_name}")
+        writer.writerows(
+            (plan_name, score, audit_name)
+            for audit_name, audit_result in individual_results.items()
+            for plan_name, score in self._get_plan_scores(audit_result).items()
+        )
 
-        return "\n".join(csv_lines)
+        return buffer.getvalue()
 
     def _export_to_markdown(self, results: Dict[str, Any]) -> str:
         """Export results to Markdown format"""
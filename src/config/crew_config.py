@@ -13,14 +13,19 @@ References:
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from crewai import Crew, Process, Task
 
 from ..agents.analysis_agent import AnalysisAgent
 from ..agents.judge_agent import PrimaryJudgeAgent, SecondaryJudgeAgent
 from ..config.llm_config import LLMManager
-from ..models.evaluation_models import EvaluationInput, PlanEvaluation
+from ..models.evaluation_models import (
+    EvaluationInput,
+    JudgmentScore,
+    PlanEvaluation,
+)
 from ..tasks.comparison_tasks import ComparisonTaskManager
 from ..tasks.evaluation_tasks import EvaluationTaskManager
 from ..tasks.synthesis_tasks import SynthesisTaskManager
@@ -529,7 +534,9 @@ class AccessibilityEvaluationCrew:
         Create sample plan evaluations for testing and demonstration.
 
         In a real implementation, this would parse actual evaluation results
-        from the individual evaluation phase.
+        from the individual evaluation phase. Comparison and synthesis both
+        request the same samples, so they are built once per plan set and
+        each caller receives its own deep copies.
 
         Args:
             evaluation_input: Input data for creating sample evaluations
@@ -537,68 +544,12 @@ class AccessibilityEvaluationCrew:
         Returns:
             List of sample PlanEvaluation objects
         """
-        from ..models.evaluation_models import JudgmentScore
-
-        sample_evaluations = []
-        plan_names = list(evaluation_input.remediation_plans.keys())
-
-        for i, plan_name in enumerate(
-            plan_names[:2]
-        ):  # Limit to first 2 plans for demo
-            # Primary judge evaluation
-            primary_eval = PlanEvaluation(
-                plan_name=plan_name,
-                judge_id="primary",
-                scores=[
-                    JudgmentScore(
-                        criterion="strategic",
-                        score=8.0 + i * 0.5,
-                        rationale=f"Strategic analysis for {plan_name}",
-                        confidence=0.8,
-                    ),
-                    JudgmentScore(
-                        criterion="technical",
-                        score=7.5 + i * 0.3,
-                        rationale=f"Technical assessment for {plan_name}",
-                        confidence=0.75,
-                    ),
-                ],
-                overall_score=7.8 + i * 0.4,
-                detailed_analysis=f"Comprehensive analysis of {plan_name}",
-                pros=[
-                    f"Strong {plan_name} approach",
-                    f"Good {plan_name} implementation",
-                ],
-                cons=[f"Minor {plan_name} issues", f"Some {plan_name} complexity"],
-            )
-            sample_evaluations.append(primary_eval)
-
-            # Secondary judge evaluation
-            secondary_eval = PlanEvaluation(
-                plan_name=plan_name,
-                judge_id="secondary",
-                scores=[
-                    JudgmentScore(
-                        criterion="strategic",
-                        score=8.2 + i * 0.3,
-                        rationale=f"Secondary strategic view for {plan_name}",
-                        confidence=0.85,
-                    ),
-                    JudgmentScore(
-                        criterion="technical",
-                        score=7.8 + i * 0.2,
-                        rationale=f"Secondary technical view for {plan_name}",
-                        confidence=0.8,
-                    ),
-                ],
-                overall_score=8.0 + i * 0.3,
-                detailed_analysis=f"Secondary analysis of {plan_name}",
-                pros=[f"Effective {plan_name} strategy", f"Clear {plan_name} guidance"],
-                cons=[f"Limited {plan_name} scope", f"Resource {plan_name} concerns"],
-            )
-            sample_evaluations.append(secondary_eval)
-
-        return sample_evaluations
+        # Limit to first 2 plans for demo
+        plan_names = tuple(evaluation_input.remediation_plans.keys())[:2]
+        return [
+            evaluation.model_copy(deep=True)
+            for evaluation in _build_sample_evaluations(plan_names)
+        ]
 
     def get_agent_status(self) -> Dict[str, Any]:
         """
@@ -618,3 +569,78 @@ class AccessibilityEvaluationCrew:
                 "synthesis_agent": "openai",
             },
         }
+
+
+@lru_cache(maxsize=1)
+def _build_sample_evaluations(
+    plan_names: Tuple[str, ...],
+) -> Tuple[PlanEvaluation, ...]:
+    """
+    Build the cached sample evaluations for the given plan names.
+
+    The returned instances are shared templates; callers must copy them
+    before handing them out (see _create_sample_evaluations).
+
+    Args:
+        plan_names: Names of the plans to create sample evaluations for
+
+    Returns:
+        Tuple of sample PlanEvaluation objects
+    """
+    sample_evaluations = []
+
+    for i, plan_name in enumerate(plan_names):
+        # Primary judge evaluation
+        primary_eval = PlanEvaluation(
+            plan_name=plan_name,
+            judge_id="primary",
+            scores=[
+                JudgmentScore(
+                    criterion="strategic",
+                    score=8.0 + i * 0.5,
+                    rationale=f"Strategic analysis for {plan_name}",
+                    confidence=0.8,
+                ),
+                JudgmentScore(
+                    criterion="technical",
+                    score=7.5 + i * 0.3,
+                    rationale=f"Technical assessment for {plan_name}",
+                    confidence=0.75,
+                ),
+            ],
+            overall_score=7.8 + i * 0.4,
+            detailed_analysis=f"Comprehensive analysis of {plan_name}",
+            pros=[
+                f"Strong {plan_name} approach",
+                f"Good {plan_name} implementation",
+            ],
+            cons=[f"Minor {plan_name} issues", f"Some {plan_name} complexity"],
+        )
+        sample_evaluations.append(primary_eval)
+
+        # Secondary judge evaluation
+        secondary_eval = PlanEvaluation(
+            plan_name=plan_name,
+            judge_id="secondary",
+            scores=[
+                JudgmentScore(
+                    criterion="strategic",
+                    score=8.2 + i * 0.3,
+                    rationale=f"Secondary strategic view for {plan_name}",
+                    confidence=0.85,
+                ),
+                JudgmentScore(
+                    criterion="technical",
+                    score=7.8 + i * 0.2,
+                    rationale=f"Secondary technical view for {plan_name}",
+                    confidence=0.8,
+                ),
+            ],
+            overall_score=8.0 + i * 0.3,
+            detailed_analysis=f"Secondary analysis of {plan_name}",
+            pros=[f"Effective {plan_name} strategy", f"Clear {plan_name} guidance"],
+            cons=[f"Limited {plan_name} scope", f"Resource {plan_name} concerns"],
+        )
+        sample_evaluations.append(secondary_eval)
+
+    return tuple(sample_evaluations)
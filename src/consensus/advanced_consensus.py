@@ -5,14 +5,30 @@ References: Master Plan - Multi-Judge Consensus, Phase 3 - Quality Assurance
 Phase 5: Advanced Features & Optimization - Consensus Mechanisms
 """
 
+import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
 
 import numpy as np
 
 from ..models.evaluation_models import JudgmentScore, PlanEvaluation
 
+# Evidence quality indicators as (pattern, weight) pairs, compiled once at
+# import so each indicator is a single alternation scan of the rationale
+_EVIDENCE_PHRASE_INDICATORS: Tuple[Tuple[Pattern[str], float], ...] = tuple(
+    (re.compile("|".join(map(re.escape, phrases))), weight)
+    for phrases, weight in (
+        (("for example", "such as", "specifically"), 0.3),  # Specific plan examples
+        (("wcag", "guideline", "level aa", "level a"), 0.2),  # WCAG references
+        (("code", "css", "html", "aria", "implementation"), 0.2),  # Technical details
+        (("user", "accessibility", "usability", "barrier"), 0.15),  # User impact
+    )
+)
+_QUANTITATIVE_UNITS_RE = re.compile("%|seconds|pixels|ratio")
+_DIGIT_RE = re.compile(r"\d")
+_QUANTITATIVE_DATA_WEIGHT = 0.15  # Includes measurable criteria
+
 
 class ConflictSeverity(Enum):
     """Enum for classifying conflict severity levels"""
@@ -23,7 +39,16 @@ class ConflictSeverity(Enum):
     CRITICAL = "critical"  # >2.0 score difference
 
 
-@dataclass
+# Severity codes produced by AdvancedConsensusEngine._classify_severities
+_SEVERITY_BY_CODE: Tuple[ConflictSeverity, ...] = (
+    ConflictSeverity.LOW,
+    ConflictSeverity.MEDIUM,
+    ConflictSeverity.HIGH,
+    ConflictSeverity.CRITICAL,
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ConflictAnalysis:
     """Data structure for analyzing conflicts between judge evaluations"""
 
@@ -69,7 +94,7 @@ class AdvancedConsensusEngine:
         Returns:
             List of detailed conflict analyses
         """
-        conflicts = []
+        matched_scores: List[Tuple[str, JudgmentScore, JudgmentScore]] = []
 
         # Group evaluations by plan
         plan_groups = self._group_evaluations_by_plan(evaluations)
@@ -84,12 +109,12 @@ class AdvancedConsensusEngine:
                 )
 
                 if primary_eval and secondary_eval:
-                    plan_conflicts = self._analyze_plan_conflicts(
-                        primary_eval, secondary_eval
+                    matched_scores.extend(
+                        self._match_plan_scores(primary_eval, secondary_eval)
                     )
-                    conflicts.extend(plan_conflicts)
 
-        return conflicts
+        # Score every plan's criteria in a single vectorized pass
+        return self._build_conflicts(matched_scores)
 
     def resolve_conflicts(
         self, conflicts: List[ConflictAnalysis]
@@ -234,50 +259,21 @@ class AdvancedConsensusEngine:
         Returns:
             Evidence quality score (0-1)
         """
-        quality_indicators = {
-            "specific_examples": 0.3,  # Contains specific examples from plan
-            "wcag_references": 0.2,  # References WCAG guidelines
-            "technical_details": 0.2,  # Includes technical implementation details
-            "user_impact": 0.15,  # Discusses user impact
-            "quantitative_data": 0.15,  # Includes measurable criteria
-        }
-
         score = 0.0
         rationale_lower = rationale.lower()
 
-        # Check for specific examples
-        if any(
-            phrase in rationale_lower
-            for phrase in ["for example", "such as", "specifically"]
-        ):
-            score += quality_indicators["specific_examples"]
-
-        # Check for WCAG references
-        if any(
-            phrase in rationale_lower
-            for phrase in ["wcag", "guideline", "level aa", "level a"]
-        ):
-            score += quality_indicators["wcag_references"]
-
-        # Check for technical details
-        if any(
-            phrase in rationale_lower
-            for phrase in ["code", "css", "html", "aria", "implementation"]
-        ):
-            score += quality_indicators["technical_details"]
-
-        # Check for user impact discussion
-        if any(
-            phrase in rationale_lower
-            for phrase in ["user", "accessibility", "usability", "barrier"]
-        ):
-            score += quality_indicators["user_impact"]
+        # Keyword-backed indicators: specific examples, WCAG references,
+        # technical details and user impact discussion
+        for pattern, weight in _EVIDENCE_PHRASE_INDICATORS:
+            if pattern.search(rationale_lower):
+                score += weight
 
-        # Check for quantitative elements
-        if any(char.isdigit() for char in rationale) and any(
-            phrase in rationale_lower for phrase in ["%", "seconds", "pixels", "ratio"]
+        # Check for quantitative elements; the unit lookup is cheaper than
+        # scanning for digits, so test it first
+        if _QUANTITATIVE_UNITS_RE.search(rationale_lower) and _DIGIT_RE.search(
+            rationale
         ):
-            score += quality_indicators["quantitative_data"]
+            score += _QUANTITATIVE_DATA_WEIGHT
 
         return min(score, 1.0)  # Cap at 1.0
 
@@ -331,40 +327,53 @@ class AdvancedConsensusEngine:
             plan_groups[evaluation.plan_name].append(evaluation)
         return plan_groups
 
-    def _analyze_plan_conflicts(
+    def _match_plan_scores(
         self, primary_eval, secondary_eval
-    ) -> List[ConflictAnalysis]:
-        """Analyze conflicts between two evaluations of the same plan"""
-        conflicts = []
-
-        # Match criteria between evaluations
+    ) -> List[Tuple[str, JudgmentScore, JudgmentScore]]:
+        """Pair up the two judges' scores for each shared criterion"""
         primary_scores = {
             score.criterion: score for score in primary_eval.judgment_scores
         }
         secondary_scores = {
             score.criterion: score for score in secondary_eval.judgment_scores
         }
+        return [
+            (primary_eval.plan_name, score, secondary_scores[criterion])
+            for criterion, score in primary_scores.items()
+            if criterion in secondary_scores
+        ]
+
+    def _build_conflicts(
+        self, matched_scores: List[Tuple[str, JudgmentScore, JudgmentScore]]
+    ) -> List[ConflictAnalysis]:
+        """Build conflict analyses for matched (plan, primary, secondary) scores"""
+        if not matched_scores:
+            return []
+
+        # Lay the matched scores out as columns and diff them in one pass
+        primary_column = np.fromiter(
+            (primary.score for _, primary, _ in matched_scores),
+            dtype=float,
+            count=len(matched_scores),
+        )
+        secondary_column = np.fromiter(
+            (secondary.score for _, _, secondary in matched_scores),
+            dtype=float,
+            count=len(matched_scores),
+        )
+        differences = np.abs(primary_column - secondary_column)
+        severities = self._classify_severities(differences)
 
-        for criterion in primary_scores:
-            if criterion in secondary_scores:
-                primary_score_obj = primary_scores[criterion]
-                secondary_score_obj = secondary_scores[criterion]
-
-                difference = abs(primary_score_obj.score - secondary_score_obj.score)
-
-                # Classify severity
-                if difference < 0.5:
-                    severity = ConflictSeverity.LOW
-                elif difference <= 1.0:
-                    severity = ConflictSeverity.MEDIUM
-                elif difference <= 2.0:
-                    severity = ConflictSeverity.HIGH
-                else:
-                    severity = ConflictSeverity.CRITICAL
-
-                conflict = ConflictAnalysis(
-                    plan_name=primary_eval.plan_name,
-                    criterion=criterion,
+        conflicts = []
+        for (
+            (plan_name, primary_score_obj, secondary_score_obj),
+            difference,
+            severity,
+        ) in zip(matched_scores, differences.tolist(), severities):
+            conflicts.append(
+                ConflictAnalysis(
+                    plan_name=plan_name,
+                    criterion=primary_score_obj.criterion,
                     primary_score=primary_score_obj.score,
                     secondary_score=secondary_score_obj.score,
                     difference=difference,
@@ -373,11 +382,27 @@ class AdvancedConsensusEngine:
                     secondary_rationale=secondary_score_obj.rationale,
                     confidence_delta=0.0,  # Placeholder for now
                 )
-
-                conflicts.append(conflict)
+            )
 
         return conflicts
 
+    def _classify_severities(self, differences: np.ndarray) -> List[ConflictSeverity]:
+        """
+        Classify an array of score differences into conflict severities
+
+        Args:
+            differences: Absolute score differences between the two judges
+
+        Returns:
+            Conflict severity for each difference, in input order
+        """
+        severity_codes = np.select(
+            [differences < 0.5, differences <= 1.0, differences <= 2.0],
+            [0, 1, 2],
+            default=3,
+        )
+        return [_SEVERITY_BY_CODE[code] for code in severity_codes.tolist()]
+
     def _calculate_judge_reliability_factor(self, conflict: ConflictAnalysis) -> float:
         """Calculate judge reliability factor for this specific conflict"""
         # Simplified implementation - could be enhanced with more sophisticated analysis
@@ -12,10 +12,11 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import psutil
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PerformanceMetrics:
     """Data structure for performance metrics"""
 
@@ -56,26 +57,11 @@ class PerformanceMonitor:
 
     def record_metrics(self, custom_metrics: Optional[Dict[str, Any]] = None):
         """Record current system performance metrics"""
-        current_metrics = PerformanceMetrics(
-            timestamp=datetime.now(),
-            memory_usage_mb=psutil.virtual_memory().used / (1024 * 1024),
-            cpu_usage_percent=psutil.cpu_percent(interval=1),
-            response_time_ms=(
-                custom_metrics.get("response_time_ms", 0) if custom_metrics else 0
-            ),
-            active_agents=(
-                custom_metrics.get("active_agents", 0) if custom_metrics else 0
-            ),
-            queue_length=custom_metrics.get("queue_length", 0) if custom_metrics else 0,
-            tokens_processed=(
-                custom_metrics.get("tokens_processed", 0) if custom_metrics else 0
-            ),
-            api_calls_made=(
-                custom_metrics.get("api_calls_made", 0) if custom_metrics else 0
-            ),
-            cache_hit_rate=(
-                custom_metrics.get("cache_hit_rate", 0) if custom_metrics else 0
-            ),
+        current_metrics = self._build_metrics(
+            datetime.now(),
+            psutil.virtual_memory().used / (1024 * 1024),
+            psutil.cpu_percent(interval=1),
+            custom_metrics,
         )
 
         self.metrics_history.append(current_metrics)
@@ -85,6 +71,59 @@ class PerformanceMonitor:
 
         return current_metrics
 
+    def record_metrics_batch(
+        self, custom_metrics_batch: List[Dict[str, Any]]
+    ) -> List[PerformanceMetrics]:
+        """
+        Record several sets of custom metrics against a single system sample
+
+        psutil is sampled once for the whole batch (cpu_percent blocks for a
+        full second per call), and every entry shares that reading.
+        """
+        if not custom_metrics_batch:
+            return []
+
+        timestamp = datetime.now()
+        memory_usage_mb = psutil.virtual_memory().used / (1024 * 1024)
+        cpu_usage_percent = psutil.cpu_percent(interval=1)
+
+        batch_metrics = [
+            self._build_metrics(
+                timestamp, memory_usage_mb, cpu_usage_percent, custom_metrics
+            )
+            for custom_metrics in custom_metrics_batch
+        ]
+
+        self.metrics_history.extend(batch_metrics)
+
+        # Check for performance issues
+        for metrics in batch_metrics:
+            self._check_performance_thresholds(metrics)
+
+        return batch_metrics
+
+    def _build_metrics(
+        self,
+        timestamp: datetime,
+        memory_usage_mb: float,
+        cpu_usage_percent: float,
+        custom_metrics: Optional[Dict[str, Any]],
+    ) -> PerformanceMetrics:
+        """Combine a system sample with optional custom metrics"""
+        custom_metrics = custom_metrics or {}
+
+        return PerformanceMetrics(
+            timestamp=timestamp,
+            memory_usage_mb=memory_usage_mb,
+            cpu_usage_percent=cpu_usage_percent,
+            response_time_ms=custom_metrics.get("response_time_ms", 0),
+            active_agents=custom_metrics.get("active_agents", 0),
+            queue_length=custom_metrics.get("queue_length", 0),
+            tokens_processed=custom_metrics.get("tokens_processed", 0),
+            api_calls_made=custom_metrics.get("api_calls_made", 0),
+            cache_hit_rate=custom_metrics.get("cache_hit_rate", 0),
+        )
+
     def _check_performance_thresholds(self, metrics: PerformanceMetrics):
         """Check if any performance thresholds are exceeded"""
         warnings = []
@@ -147,12 +186,14 @@ class PerformanceMonitor:
         self, metrics: List[PerformanceMetrics]
     ) -> Dict[str, float]:
         """Analyze memory usage patterns"""
-        memory_values = [m.memory_usage_mb for m in metrics]
+        memory_values = np.fromiter(
+            (m.memory_usage_mb for m in metrics), dtype=float, count=len(metrics)
+        )
 
         return {
-            "average_mb": sum(memory_values) / len(memory_values),
-            "peak_mb": max(memory_values),
-            "min_mb": min(memory_values),
+            "average_mb": float(memory_values.mean()),
+            "peak_mb": float(memory_values.max()),
+            "min_mb": float(memory_values.min()),
             "growth_rate_mb_per_hour": self._calculate_growth_rate(
                 metrics, "memory_usage_mb"
             ),
@@ -160,12 +201,14 @@ class PerformanceMonitor:
 
     def _analyze_cpu_usage(self, metrics: List[PerformanceMetrics]) -> Dict[str, float]:
         """Analyze CPU usage patterns"""
-        cpu_values = [m.cpu_usage_percent for m in metrics]
+        cpu_values = np.fromiter(
+            (m.cpu_usage_percent for m in metrics), dtype=float, count=len(metrics)
+        )
 
         return {
-            "average_percent": sum(cpu_values) / len(cpu_values),
-            "peak_percent": max(cpu_values),
-            "min_percent": min(cpu_values),
+            "average_percent": float(cpu_values.mean()),
+            "peak_percent": float(cpu_values.max()),
+            "min_percent": float(cpu_values.min()),
         }
 
     def _analyze_response_times(
@@ -297,8 +340,15 @@ class CacheManager:
         self, audit_content: str, plan_content: str, evaluation_type: str
     ) -> str:
         """Generate unique cache key for evaluation input"""
-        combined_content = f"{audit_content}:{plan_content}:{evaluation_type}"
-        return hashlib.sha256(combined_content.encode()).hexdigest()
+        # Feed each part to the hash separately rather than concatenating
+        # large audit/plan documents into one temporary string first
+        key_hash = hashlib.blake2b(digest_size=32)
+        key_hash.update(audit_content.encode())
+        key_hash.update(b":")
+        key_hash.update(plan_content.encode())
+        key_hash.update(b":")
+        key_hash.update(evaluation_type.encode())
+        return key_hash.hexdigest()
 
     def get_cached_result(self, cache_key: str) -> Optional[Any]:
         """Retrieve cached evaluation result"""
@@ -11,7 +11,6 @@ References:
     - LLM Error Handling Enhancement Plan - Phase 3
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -41,6 +40,7 @@ from ...models.evaluation_models import (
     PartialEvaluationSummary,
     ResilienceInfo,
 )
+from ...utils.json_encoding import dumps_json_bytes
 
 
 class EvaluationReportGenerator:
@@ -1305,8 +1305,7 @@ Analysis: {plan_data.get('analysis', 'No analysis available')}
             export_data["completion_statistics"] = completion_stats
 
         # Write JSON
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, default=str)
+        output_path.write_bytes(dumps_json_bytes(export_data))
 
         return output_path
 
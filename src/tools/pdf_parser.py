@@ -4,6 +4,8 @@ References: Master Plan - Data Processing section
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -104,15 +106,35 @@ class PDFParser:
             logger.warning(f"No plan files found in {plans_directory}")
             return plans
 
+        named_files = []
         for plan_file in plan_files:
-            try:
-                plan_name = self._extract_plan_name(plan_file.stem)
-                if plan_name:
-                    plans[plan_name] = self.parse_remediation_plan(plan_file)
+            plan_name = self._extract_plan_name(plan_file.stem)
+            if plan_name:
+                named_files.append((plan_name, plan_file))
+
+        if not named_files:
+            return plans
+
+        # Text extraction is CPU-bound pure Python, so spread plans across
+        # processes rather than threads
+        max_workers = min(len(named_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (
+                    plan_name,
+                    plan_file,
+                    executor.submit(self.parse_remediation_plan, plan_file),
+                )
+                for plan_name, plan_file in named_files
+            ]
+
+            for plan_name, plan_file, future in futures:
+                try:
+                    plans[plan_name] = future.result()
                     logger.info(f"Successfully parsed {plan_name}")
-            except Exception as e:
-                logger.error(f"Failed to parse {plan_file}: {e}")
-                continue
+                except Exception as e:
+                    logger.error(f"Failed to parse {plan_file}: {e}")
+                    continue
 
         return plans
 
@@ -0,0 +1,44 @@
+"""
+JSON encoding helpers for result exports.
+
+This module provides a single orjson-backed encoder so batch and report
+exports serialize results the same way.
+
+References:
+    - Master Plan: Output formats and documentation
+"""
+
+import json
+from typing import Any
+
+import orjson
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+def dumps_json_bytes(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON bytes with orjson.
+
+    Datetimes and dataclasses are passed through to default=str. Non-ASCII
+    text is written unescaped and NaN/Infinity are written as null. Values
+    orjson cannot encode, such as integers wider than 64 bits, fall back to
+    the stdlib encoder.
+
+    Args:
+        data: JSON-compatible data to serialize
+
+    Returns:
+        Encoded JSON document
+    """
+    try:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        return json.dumps(data, indent=2, default=str, ensure_ascii=False).encode(
+            "utf-8"
+        )
@@ -25,6 +25,7 @@ from .llm_exceptions import (
     PartialEvaluationError,
     classify_llm_error,
 )
+from .timestamps import now_timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -297,7 +298,7 @@ class LLMResilienceManager:
             "status": "NA",
             "na_reason": reason,
             "llm_used": llm_type,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now_timestamp(),
             "success": False,
             "error": reason,
         }
@@ -415,7 +416,7 @@ class LLMResilienceManager:
                         "evaluation_content": result["content"],
                         "status": "completed",
                         "llm_used": "gemini",
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        "timestamp": now_timestamp(),
                         "success": True,
                     }
                 else:
@@ -444,7 +445,7 @@ class LLMResilienceManager:
                         "evaluation_content": result["content"],
                         "status": "completed",
                         "llm_used": "openai",
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        "timestamp": now_timestamp(),
                         "success": True,
                     }
                 else:
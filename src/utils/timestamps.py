@@ -0,0 +1,14 @@
+"""
+Timestamp helpers for agent and workflow results.
+
+Results carry human-readable local timestamps in ``YYYY-MM-DD HH:MM:SS``
+form; this module produces them in one place.
+"""
+
+from datetime import datetime
+
+
+def now_timestamp() -> str:
+    """Current local time as ``YYYY-MM-DD HH:MM:SS`` for result timestamps"""
+    # isoformat is implemented in C and avoids strftime's format parsing
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
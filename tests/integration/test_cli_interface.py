@@ -18,6 +18,11 @@ import pytest
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from main import AccessibilityEvaluationCLI  # noqa: E402
+from src.reports.generators.evaluation_report_generator import (  # noqa: E402
+    EvaluationReportGenerator,
+)
+
 
 class TestCLIInterface:
     """Integration tests for CLI functionality"""
@@ -215,9 +220,6 @@ except ImportError as e:
             assert subdir.exists()
 
             # Import and test the cleanup method
-            sys.path.insert(0, str(project_root))
-            from main import AccessibilityEvaluationCLI
-
             cli = AccessibilityEvaluationCLI()
             cli.clear_historical_data(output_dir)
 
@@ -259,9 +261,6 @@ except ImportError as e:
             assert sample_results["plans"]["PlanB"]["overall_score"] == 7.2
 
             # Import and test the CLI
-            sys.path.insert(0, str(project_root))
-            from main import AccessibilityEvaluationCLI
-
             cli = AccessibilityEvaluationCLI()
 
             # Test that CLI can generate enhanced reports
@@ -277,11 +276,6 @@ except ImportError as e:
             output_dir.mkdir()
 
             # Import the report generator to test unified report generation
-            sys.path.insert(0, str(project_root))
-            from src.reports.generators.evaluation_report_generator import (
-                EvaluationReportGenerator,
-            )
-
             report_generator = EvaluationReportGenerator()
 
             # Test unified report generation
@@ -311,11 +305,6 @@ except ImportError as e:
             output_dir.mkdir()
 
             # Import the report generator
-            sys.path.insert(0, str(project_root))
-            from src.reports.generators.evaluation_report_generator import (
-                EvaluationReportGenerator,
-            )
-
             report_generator = EvaluationReportGenerator()
 
             # Test enhanced styling features
@@ -353,9 +342,6 @@ except ImportError as e:
             assert len(list(output_dir.glob("*"))) == 0
 
             # Import and test the cleanup method
-            sys.path.insert(0, str(project_root))
-            from main import AccessibilityEvaluationCLI
-
             cli = AccessibilityEvaluationCLI()
 
             # Should not raise any errors
@@ -375,9 +361,6 @@ except ImportError as e:
             assert not output_dir.exists()
 
             # Import and test the cleanup method
-            sys.path.insert(0, str(project_root))
-            from main import AccessibilityEvaluationCLI
-
             cli = AccessibilityEvaluationCLI()
 
             # Should not raise any errors and should create directory
@@ -4,6 +4,7 @@ References: Master Plan - Testing Standards, Phase 2 - Agent Validation
 """
 
 import logging
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -11,12 +12,13 @@ import pytest
 
 from src.agents.analysis_agent import AnalysisAgent
 from src.agents.judge_agent import PrimaryJudgeAgent, SecondaryJudgeAgent
-from src.agents.scoring_agent import ScoringAgent
+from src.agents.scoring_agent import DEFAULT_CRITERIA_WEIGHTS, ScoringAgent
 from src.agents.tools.evaluation_framework import EvaluationFrameworkTool
 from src.agents.tools.gap_analyzer import GapAnalyzerTool
 from src.agents.tools.plan_comparator import PlanComparatorTool
 from src.agents.tools.scoring_calculator import ScoringCalculatorTool
 from src.config.llm_config import LLMManager
+from src.monitoring.performance_monitor import CacheManager
 
 
 class TestAgentTools:
@@ -651,6 +653,28 @@ class TestJudgeAgents:
         assert result["evaluator"] == "Secondary Judge (GPT-4)"
         assert result["includes_primary_comparison"] is True
 
+    @patch("src.config.llm_config.LLMManager")
+    def test_judge_prompts_share_plan_independent_prefix(self, mock_llm_manager):
+        """Test that evaluation prompts put plan-specific text last"""
+        mock_llm_manager.gemini = Mock()
+        mock_llm_manager.gemini.invoke.return_value = Mock(content="Evaluation")
+        mock_llm_manager.openai = Mock()
+        mock_llm_manager.openai.invoke.return_value = Mock(content="Evaluation")
+
+        for agent in (
+            PrimaryJudgeAgent(mock_llm_manager),
+            SecondaryJudgeAgent(mock_llm_manager),
+        ):
+            agent.evaluate_plan("PlanA", "Plan A content", "Shared audit")
+            agent.evaluate_plan("PlanB", "Plan B content", "Shared audit")
+            first, second = [c.args[0] for c in agent.llm.invoke.call_args_list[-2:]]
+
+            audit_start = first.index("Shared audit")
+            assert first[:audit_start] == second[:audit_start]
+            assert "PlanA" not in first[:audit_start]
+            assert first.index("PlanA") > audit_start
+            assert "Long-term Vision" in first[:audit_start]
+
 
 class TestScoringAgent:
     """Test suite for scoring agent"""
@@ -802,6 +826,113 @@ class TestScoringAgent:
         assert "plan_scores" in result
         assert "rankings" in result
 
+    @patch("src.config.llm_config.LLMManager")
+    def test_scoring_prompt_leads_with_instructions(self, mock_llm_manager):
+        """Test that the scoring prompt puts evaluation data after the instructions"""
+        mock_llm_manager.gemini = Mock()
+        mock_llm_manager.gemini.invoke.return_value = Mock(content="Analysis")
+        agent = ScoringAgent(mock_llm_manager)
+
+        agent.calculate_final_scores(
+            [{"plan_name": "PlanA", "success": True, "evaluation_content": "x"}],
+            {"Strategic Prioritization": 1.0},
+        )
+
+        prompt = mock_llm_manager.gemini.invoke.call_args.args[0]
+        assert prompt.index("ANALYSIS REQUIREMENTS") < prompt.index("EVALUATION DATA")
+        assert prompt.index("EVALUATION DATA") < prompt.index("PlanA")
+
+    @patch("src.agents.scoring_agent.Agent")
+    @patch("src.config.llm_config.LLMManager")
+    def test_scoring_agent_creates_agent_lazily(self, mock_llm_manager, mock_agent):
+        """Test that scoring without the CrewAI agent never builds it"""
+        mock_llm_manager.gemini = Mock()
+        agent = ScoringAgent(mock_llm_manager)
+
+        agent._parse_scores_from_text("Strategic: 8")
+
+        mock_agent.assert_not_called()
+
+    @patch("src.config.llm_config.LLMManager")
+    def test_calculate_final_scores_default_weights(self, mock_llm_manager):
+        """Test the framework weights are used when none are supplied"""
+        mock_llm_manager.gemini = Mock()
+        mock_llm_manager.gemini.invoke.return_value = Mock(content="Analysis")
+        agent = ScoringAgent(mock_llm_manager)
+
+        result = agent.calculate_final_scores(
+            [
+                {
+                    "plan_name": "PlanA",
+                    "success": True,
+                    "evaluation_content": "Strategic: 10 Technical: 5",
+                }
+            ]
+        )
+
+        assert result["success"] is True
+        assert result["criteria_weights"] == dict(DEFAULT_CRITERIA_WEIGHTS)
+        assert type(result["criteria_weights"]) is dict
+        assert result["plan_scores"]["PlanA"] == pytest.approx(5.5 / 0.7)
+
+    @patch("src.config.llm_config.LLMManager")
+    def test_format_evaluations_for_analysis(self, mock_llm_manager):
+        """Test evaluations are formatted compactly and failures skipped"""
+        mock_llm_manager.gemini = Mock()
+        agent = ScoringAgent(mock_llm_manager)
+
+        formatted = agent._format_evaluations_for_analysis(
+            [
+                {
+                    "plan_name": "PlanA",
+                    "evaluator": "Primary",
+                    "evaluation_content": "x" * 600,
+                    "success": True,
+                },
+                {"plan_name": "PlanB", "evaluation_content": None, "success": True},
+                {"plan_name": "PlanC", "success": False},
+            ]
+        )
+
+        assert formatted.splitlines() == [
+            f"Plan: PlanA | Evaluator: Primary | Content: {'x' * 500}...",
+            "Plan: PlanB | Evaluator: Unknown | Content: ...",
+        ]
+
+    @patch("src.config.llm_config.LLMManager")
+    def test_parse_scores_from_text(self, mock_llm_manager):
+        """Test score extraction takes the first number after each criterion"""
+        mock_llm_manager.gemini = Mock()
+        agent = ScoringAgent(mock_llm_manager)
+
+        scores = agent._parse_scores_from_text(
+            "STRATEGIC Prioritization: 8/10\n"
+            "Technical Specificity - 7.5\n"
+            "Comprehensiveness: 12\n"
+            "Long-term vision, not scored"
+        )
+
+        assert scores == {
+            "Strategic Prioritization": 8.0,
+            "Technical Specificity": 7.5,
+            "Comprehensiveness": 10.0,
+        }
+
+    @patch("src.config.llm_config.LLMManager")
+    def test_compare_plans_reuses_cached_response(self, mock_llm_manager):
+        """Test that an identical comparison is served from the cache"""
+        mock_llm_manager.gemini = Mock()
+        mock_llm_manager.gemini.invoke.return_value = Mock(content="Plan A wins")
+        agent = ScoringAgent(mock_llm_manager, cache_manager=CacheManager())
+        plan_a = {"name": "PlanA", "content": "a"}
+        plan_b = {"name": "PlanB", "content": "b"}
+
+        first = agent.compare_plans(plan_a, plan_b, [])
+        second = agent.compare_plans(plan_a, plan_b, [])
+
+        assert mock_llm_manager.gemini.invoke.call_count == 1
+        assert second["comparison_analysis"] == first["comparison_analysis"]
+
     @patch("src.config.llm_config.LLMManager")
     def test_compare_plans(self, mock_llm_manager):
         """Test plan comparison functionality"""
@@ -948,7 +1079,7 @@ class TestAnalysisAgent:
         mock_llm_manager.openai = Mock()
 
         # This tests the exception handling in _initialize_tools
-        with patch("src.agents.analysis_agent.GapAnalyzerTool") as mock_gap_tool:
+        with patch("src.agents.tools.gap_analyzer.GapAnalyzerTool") as mock_gap_tool:
             mock_gap_tool.side_effect = Exception("Tool initialization failed")
 
             agent = AnalysisAgent(mock_llm_manager)
@@ -1117,5 +1248,41 @@ class TestAgentIntegration:
         assert all(eval_data["success"] for eval_data in evaluations)
 
 
+class TestAgentPackageExports:
+    """Test suite for the lazy re-exports in src.agents"""
+
+    def test_package_exports_resolve_to_agent_classes(self):
+        """Test that package-level names resolve to the submodule classes"""
+        import src.agents as agents
+
+        assert agents.PrimaryJudgeAgent is PrimaryJudgeAgent
+        assert agents.SecondaryJudgeAgent is SecondaryJudgeAgent
+        assert agents.ScoringAgent is ScoringAgent
+        assert agents.AnalysisAgent is AnalysisAgent
+        assert set(agents.__all__) <= set(dir(agents))
+
+    def test_unknown_package_attribute_raises(self):
+        """Test that unknown names still raise AttributeError"""
+        import src.agents as agents
+
+        with pytest.raises(AttributeError):
+            agents.NotAnAgent
+
+    def test_submodule_import_does_not_load_agents(self, fresh_import):
+        """Test that importing a tool does not import every agent module"""
+        fresh_import("src.agents.tools.gap_analyzer", "src")
+
+        loaded = [
+            module
+            for module in (
+                "src.agents.judge_agent",
+                "src.agents.scoring_agent",
+                "src.agents.analysis_agent",
+            )
+            if module in sys.modules
+        ]
+        assert not loaded, loaded
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
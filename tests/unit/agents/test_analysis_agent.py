@@ -1,9 +1,13 @@
 """Tests for analysis agent."""
 
+import asyncio
+import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.agents.analysis_agent import AnalysisAgent
+from src.monitoring.performance_monitor import CacheManager
 
 
 class TestAnalysisAgent(unittest.TestCase):
@@ -54,8 +58,8 @@ class TestAnalysisAgent(unittest.TestCase):
         """Test agent delegation configuration."""
         self.assertFalse(self.agent_wrapper.agent.allow_delegation)
 
-    @patch("src.agents.analysis_agent.GapAnalyzerTool")
-    @patch("src.agents.analysis_agent.PlanComparatorTool")
+    @patch("src.agents.tools.gap_analyzer.GapAnalyzerTool")
+    @patch("src.agents.tools.plan_comparator.PlanComparatorTool")
     def test_tools_initialization_success(self, mock_comparator, mock_analyzer):
         """Test successful tools initialization."""
         mock_llm_manager = MagicMock()
@@ -64,7 +68,8 @@ class TestAnalysisAgent(unittest.TestCase):
         self.assertEqual(len(agent.tools), 2)
 
     @patch(
-        "src.agents.analysis_agent.GapAnalyzerTool", side_effect=Exception("Tool error")
+        "src.agents.tools.gap_analyzer.GapAnalyzerTool",
+        side_effect=Exception("Tool error"),
     )
     @patch("src.agents.analysis_agent.logger")
     def test_tools_initialization_failure(self, mock_logger, mock_analyzer):
@@ -299,6 +304,15 @@ class TestAnalysisAgentAdditionalCoverage(unittest.TestCase):
         self.assertIn("large", result)
         self.assertIn("healthcare", result)
         self.assertIn("high", result)
+        self.assertEqual(
+            result.split("\n"),
+            [
+                "Organization_Size: large",
+                "Industry: healthcare",
+                "Technical_Maturity: high",
+                "Budget: sufficient",
+            ],
+        )
 
     def test_format_organizational_context_empty(self):
         """Test organizational context formatting with empty data."""
@@ -342,6 +356,55 @@ class TestAnalysisAgentAdditionalCoverage(unittest.TestCase):
         # The method just returns the content if no pattern matches
         self.assertEqual(result, content)
 
+    def test_extract_primary_recommendation_first_keyword_line(self):
+        """Test that the first keyword line is returned, matched case-insensitively."""
+        content = "Overview of findings\n  TOP priority: Plan B  \nWe recommend Plan C"
+
+        result = self.agent_wrapper._extract_primary_recommendation(content)
+
+        self.assertEqual(result, "TOP priority: Plan B")
+        self.assertEqual(
+            self.agent_wrapper._extract_primary_recommendation("Best " + "x" * 300),
+            "Best " + "x" * 195,
+        )
+        self.assertEqual(
+            self.agent_wrapper._extract_primary_recommendation("No keywords\nhere"),
+            "See full analysis for recommendations",
+        )
+
+    def test_prompt_context_is_bounded(self):
+        """Test that plan content and evaluation previews are truncated."""
+        agent = AnalysisAgent(MagicMock(), max_plan_context=50)
+        evaluations = [
+            {"success": True, "plan_name": "A", "evaluation_content": "e" * 500},
+            {"success": True, "plan_name": "B", "evaluation_content": None},
+        ]
+
+        prompt = agent._build_readiness_prompt("A", "p" * 100 + "TAIL", evaluations)
+
+        self.assertIn("p" * 50 + "...", prompt)
+        self.assertNotIn("p" * 51, prompt)
+        self.assertNotIn("TAIL", prompt)
+        self.assertIn("Plan A (Unknown): " + "e" * 200 + "...", prompt)
+        self.assertNotIn("e" * 201, prompt)
+        self.assertIn("Plan B (Unknown): ...", prompt)
+
+    def test_result_timestamps_keep_seconds_format(self):
+        """Test that success and error results share the timestamp format."""
+        success = self.agent_wrapper.generate_executive_summary({})
+        with patch.object(
+            self.agent_wrapper.llm, "invoke", side_effect=Exception("LLM error")
+        ):
+            failure = self.agent_wrapper.generate_executive_summary({})
+
+        for result in (success, failure):
+            self.assertEqual(
+                datetime.strptime(result["timestamp"], "%Y-%m-%d %H:%M:%S").strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                ),
+                result["timestamp"],
+            )
+
     def test_get_agent_info(self):
         """Test agent information retrieval."""
         result = self.agent_wrapper.get_agent_info()
@@ -358,5 +421,288 @@ class TestAnalysisAgentAdditionalCoverage(unittest.TestCase):
         )
 
 
+class TestAnalysisAgentResponseCache(unittest.TestCase):
+    """Test cases for reusing LLM responses through a CacheManager."""
+
+    def setUp(self):
+        """Set up an agent with a shared cache and a mocked LLM."""
+        self.cache_manager = CacheManager(max_cache_size_mb=16)
+        self.agent_wrapper = AnalysisAgent(
+            MagicMock(), cache_manager=self.cache_manager
+        )
+        mock_response = MagicMock()
+        mock_response.content = "Cached analysis response"
+        self.agent_wrapper.llm = MagicMock()
+        self.agent_wrapper.llm.invoke.return_value = mock_response
+        self.evaluations = [
+            {
+                "success": True,
+                "plan_name": "PlanA",
+                "evaluator": "Gemini",
+                "evaluation_content": "Strong keyboard coverage",
+            }
+        ]
+        self.scoring_results = {"success": True, "rankings": [("PlanA", 8.5)]}
+
+    def test_identical_prompt_reuses_cached_response(self):
+        """Test that a repeated analysis only calls the LLM once."""
+        first = self.agent_wrapper.generate_strategic_analysis(
+            self.evaluations, self.scoring_results
+        )
+        second = self.agent_wrapper.generate_strategic_analysis(
+            self.evaluations, self.scoring_results
+        )
+
+        self.assertEqual(self.agent_wrapper.llm.invoke.call_count, 1)
+        self.assertEqual(first["analysis_content"], second["analysis_content"])
+        self.assertEqual(self.cache_manager.get_cache_statistics()["hit_rate"], 0.5)
+
+    def test_cache_is_shared_between_agents(self):
+        """Test that agents given the same cache reuse each other's responses."""
+        self.agent_wrapper.generate_executive_summary({"scoring": {"success": True}})
+        other_agent = AnalysisAgent(MagicMock(), cache_manager=self.cache_manager)
+        other_agent.llm = self.agent_wrapper.llm
+
+        result = other_agent.generate_executive_summary({"scoring": {"success": True}})
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.agent_wrapper.llm.invoke.call_count, 1)
+
+    def test_cache_is_not_shared_between_llm_configurations(self):
+        """Test that a different model or temperature misses the cache."""
+        scoring = {"scoring": {"success": True}}
+        for model_name, temperature in [
+            ("gpt-4", 0.1),
+            ("gpt-4o-mini", 0.1),
+            ("gpt-4", 0.7),
+            ("gpt-4", 0.1),
+        ]:
+            agent = AnalysisAgent(MagicMock(), cache_manager=self.cache_manager)
+            agent.llm = MagicMock(model_name=model_name, temperature=temperature)
+            agent.llm.invoke.return_value = MagicMock(content=model_name)
+            agent.generate_executive_summary(scoring)
+
+        # Only the repeated (gpt-4, 0.1) configuration is served from the cache
+        self.assertEqual(self.cache_manager.get_cache_statistics()["hit_rate"], 0.25)
+
+    def test_different_inputs_and_failures_are_not_cached(self):
+        """Test that changed prompts and LLM errors always reach the LLM."""
+        self.agent_wrapper.generate_strategic_analysis(
+            self.evaluations, self.scoring_results
+        )
+        self.agent_wrapper.generate_strategic_analysis(
+            self.evaluations, self.scoring_results, {"size": "large"}
+        )
+        self.assertEqual(self.agent_wrapper.llm.invoke.call_count, 2)
+
+        self.agent_wrapper.llm.invoke.side_effect = Exception("LLM error")
+        failed = self.agent_wrapper.analyze_implementation_readiness(
+            "PlanA", "content", self.evaluations
+        )
+        self.assertFalse(failed["success"])
+        self.assertEqual(len(self.cache_manager.cache), 2)
+
+    def test_no_cache_manager_always_invokes_llm(self):
+        """Test that caching is opt-in."""
+        agent = AnalysisAgent(MagicMock())
+        agent.llm = self.agent_wrapper.llm
+
+        agent.generate_strategic_analysis(self.evaluations, self.scoring_results)
+        agent.generate_strategic_analysis(self.evaluations, self.scoring_results)
+
+        self.assertEqual(agent.llm.invoke.call_count, 2)
+
+
+class TestAnalysisAgentFullAnalysis(unittest.TestCase):
+    """Test cases for the batched full analysis pipeline."""
+
+    def setUp(self):
+        """Set up an agent whose LLM supports invoke and batch."""
+        self.agent_wrapper = AnalysisAgent(MagicMock())
+        self.agent_wrapper.llm = MagicMock()
+        self.agent_wrapper.llm.batch.return_value = [
+            MagicMock(content="We recommend PlanA"),
+            MagicMock(content="Ready to start"),
+        ]
+        self.agent_wrapper.llm.invoke.return_value = MagicMock(content="Summary")
+        self.evaluations = [{"success": True, "plan_name": "PlanA"}]
+        self.scoring_results = {"success": True, "rankings": [("PlanA", 8.5)]}
+
+    def test_independent_steps_share_one_batch_call(self):
+        """Test that strategic and readiness prompts are batched together."""
+        result = self.agent_wrapper.run_full_analysis(
+            self.evaluations, self.scoring_results, "PlanA", "Plan content"
+        )
+
+        self.agent_wrapper.llm.batch.assert_called_once()
+        prompts = self.agent_wrapper.llm.batch.call_args.args[0]
+        self.assertEqual(len(prompts), 2)
+        self.assertIn("STRATEGIC ANALYSIS REQUIREMENTS", prompts[0])
+        self.assertIn("READINESS ASSESSMENT REQUIREMENTS", prompts[1])
+        self.assertEqual(
+            self.agent_wrapper.llm.batch.call_args.kwargs, {"return_exceptions": True}
+        )
+        self.agent_wrapper.llm.invoke.assert_called_once()
+
+        strategic = result["strategic_analysis"]
+        self.assertTrue(strategic["success"])
+        self.assertEqual(strategic["primary_recommendation"], "We recommend PlanA")
+        readiness = result["implementation_readiness"]
+        self.assertEqual(readiness["readiness_content"], "Ready to start")
+        self.assertEqual(readiness["recommended_plan"], "PlanA")
+        self.assertEqual(
+            result["executive_summary"]["data_sources"],
+            ["scoring_results", "strategic_analysis", "implementation_readiness"],
+        )
+
+    def test_evaluation_summary_is_formatted_once(self):
+        """Test that both batched prompts share one formatted summary."""
+        with patch.object(
+            AnalysisAgent,
+            "_format_evaluations_summary",
+            autospec=True,
+            return_value="Shared evaluation summary",
+        ) as mock_format:
+            self.agent_wrapper.run_full_analysis(
+                self.evaluations, self.scoring_results, "PlanA", "Plan content"
+            )
+
+        mock_format.assert_called_once_with(self.agent_wrapper, self.evaluations)
+        prompts = self.agent_wrapper.llm.batch.call_args.args[0]
+        self.assertTrue(all("Shared evaluation summary" in p for p in prompts))
+
+    def test_failed_batch_item_only_fails_its_step(self):
+        """Test that one failing prompt does not discard the other result."""
+        self.agent_wrapper.llm.batch.return_value = [
+            Exception("rate limit exceeded"),
+            MagicMock(content="Ready to start"),
+        ]
+
+        result = self.agent_wrapper.run_full_analysis(
+            self.evaluations, self.scoring_results, "PlanA", "Plan content"
+        )
+
+        self.assertFalse(result["strategic_analysis"]["success"])
+        self.assertIn("rate limit", result["strategic_analysis"]["error"])
+        self.assertTrue(result["implementation_readiness"]["success"])
+        self.assertTrue(result["executive_summary"]["success"])
+
+    def test_batch_call_failure_is_reported_for_both_steps(self):
+        """Test that an exception from the batch call itself is contained."""
+        self.agent_wrapper.llm.batch.side_effect = Exception("connection reset")
+
+        result = self.agent_wrapper.run_full_analysis(
+            self.evaluations, self.scoring_results, "PlanA", "Plan content"
+        )
+
+        self.assertFalse(result["strategic_analysis"]["success"])
+        self.assertFalse(result["implementation_readiness"]["success"])
+
+    def test_cached_prompts_are_left_out_of_the_batch(self):
+        """Test that only uncached prompts are sent to the LLM."""
+        self.agent_wrapper.cache_manager = CacheManager(max_cache_size_mb=16)
+        self.agent_wrapper.analyze_implementation_readiness(
+            "PlanA", "Plan content", self.evaluations
+        )
+        self.agent_wrapper.llm.batch.return_value = [
+            MagicMock(content="We recommend PlanA")
+        ]
+
+        result = self.agent_wrapper.run_full_analysis(
+            self.evaluations, self.scoring_results, "PlanA", "Plan content"
+        )
+
+        self.assertEqual(len(self.agent_wrapper.llm.batch.call_args.args[0]), 1)
+        self.assertEqual(
+            result["implementation_readiness"]["readiness_content"], "Summary"
+        )
+        self.assertTrue(result["strategic_analysis"]["success"])
+
+
+class TestAnalysisAgentAsync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the async analysis variants."""
+
+    def _make_agent(self, content="Async analysis response"):
+        """Create an agent whose LLM only supports ainvoke."""
+        agent = AnalysisAgent(MagicMock())
+        agent.llm = MagicMock()
+        agent.llm.ainvoke = AsyncMock(return_value=MagicMock(content=content))
+        return agent
+
+    async def test_async_variants_return_sync_shaped_results(self):
+        """Test that async methods mirror the sync result structures."""
+        agent = self._make_agent("We recommend PlanA")
+        evaluations = [{"success": True, "plan_name": "PlanA"}]
+
+        strategic = await agent.agenerate_strategic_analysis(
+            evaluations, {"success": True}
+        )
+        readiness = await agent.aanalyze_implementation_readiness(
+            "PlanA", "Plan content", evaluations
+        )
+        summary = await agent.agenerate_executive_summary({"strategic": strategic})
+
+        self.assertEqual(strategic["primary_recommendation"], "We recommend PlanA")
+        self.assertEqual(readiness["recommended_plan"], "PlanA")
+        self.assertEqual(summary["data_sources"], ["strategic"])
+        self.assertEqual(agent.llm.ainvoke.await_count, 3)
+        agent.llm.invoke.assert_not_called()
+
+    async def test_agents_run_concurrently_under_gather(self):
+        """Test that several agents overlap their LLM calls."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_ainvoke(prompt):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(content="done")
+
+        agents = [self._make_agent() for _ in range(3)]
+        for agent in agents:
+            agent.llm.ainvoke = slow_ainvoke
+
+        results = await asyncio.gather(
+            *(agent.agenerate_strategic_analysis([], {}) for agent in agents)
+        )
+
+        self.assertTrue(all(result["success"] for result in results))
+        self.assertEqual(max_in_flight, 3)
+
+    async def test_async_failure_returns_error_result(self):
+        """Test that async LLM errors are classified like sync ones."""
+        agent = self._make_agent()
+        agent.llm.ainvoke.side_effect = Exception("LLM error")
+
+        result = await agent.aanalyze_implementation_readiness("PlanA", "", [])
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "LLM error")
+        self.assertIn("error_type", result)
+
+    async def test_async_variant_uses_response_cache(self):
+        """Test that async calls share the cache with sync calls."""
+        agent = self._make_agent()
+        agent.cache_manager = CacheManager(max_cache_size_mb=16)
+        agent.llm.invoke.return_value = MagicMock(content="Sync response")
+        agent.generate_executive_summary({"scoring": {"success": True}})
+
+        result = await agent.agenerate_executive_summary({"scoring": {"success": True}})
+
+        self.assertEqual(result["summary_content"], "Sync response")
+        agent.llm.ainvoke.assert_not_awaited()
+
+
+def test_module_import_defers_crewai(fresh_import):
+    """Test that importing the module imports neither CrewAI nor its tools."""
+    fresh_import("src.agents.analysis_agent", "src", "crewai", "crewai_tools")
+
+    assert "crewai" not in sys.modules
+    assert "crewai_tools" not in sys.modules
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,15 @@
 """Tests for judge agents."""
 
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.agents.judge_agent import PrimaryJudgeAgent, SecondaryJudgeAgent
+from src.agents.judge_agent import (
+    PrimaryJudgeAgent,
+    SecondaryJudgeAgent,
+    evaluate_plans_concurrently,
+)
+from src.monitoring.performance_monitor import CacheManager
 
 
 class TestJudgeAgents(unittest.TestCase):
@@ -33,6 +39,120 @@ class TestJudgeAgents(unittest.TestCase):
             self.assertIsNotNone(judge.agent)
             self.assertIsNotNone(judge.llm)
 
+    def test_primary_judge_creates_agent_on_first_access(self):
+        """Test that the CrewAI agent is only built when it is needed."""
+        with patch("src.agents.judge_agent.Agent") as mock_agent:
+            judge = PrimaryJudgeAgent(MagicMock())
+            mock_agent.assert_not_called()
+
+            self.assertIs(judge.agent, judge.agent)
+            mock_agent.assert_called_once()
+
+    def test_judge_reuses_cached_evaluation(self):
+        """Test that a repeated evaluation is served from the cache."""
+        cache_manager = CacheManager()
+        judge = PrimaryJudgeAgent(MagicMock(), cache_manager=cache_manager)
+        judge.llm = MagicMock()
+        judge.llm.invoke.return_value = MagicMock(content="Score: 8")
+
+        first = judge.evaluate_plan("PlanA", "content", "audit")
+        second = judge.evaluate_plan("PlanA", "content", "audit")
+        judge.evaluate_plan("PlanB", "content", "audit")
+
+        self.assertEqual(judge.llm.invoke.call_count, 2)
+        self.assertEqual(first["evaluation_content"], second["evaluation_content"])
+        self.assertTrue(second["success"])
+
+    def test_uncached_evaluation_logs_llm_latency(self):
+        """Test that LLM calls are timed at debug level."""
+        judge = PrimaryJudgeAgent(MagicMock())
+        judge.llm = MagicMock()
+        judge.llm.invoke.return_value = MagicMock(content="Score: 8")
+
+        with self.assertLogs("src.agents.response_cache", level="DEBUG") as logs:
+            judge.evaluate_plan("PlanA", "content", "audit")
+
+        self.assertIn("LLM call for primary_evaluation took", logs.output[0])
+
+
+class TestJudgeAgentsAsync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for async judge evaluation."""
+
+    def _make_judges(self):
+        """Create both judges with LLMs that only support ainvoke."""
+        primary = PrimaryJudgeAgent(MagicMock())
+        primary.llm = MagicMock()
+        primary.llm.ainvoke = AsyncMock(return_value=MagicMock(content="Primary"))
+        secondary = SecondaryJudgeAgent(MagicMock())
+        secondary._llm = MagicMock()
+        secondary._llm.ainvoke = AsyncMock(return_value=MagicMock(content="Secondary"))
+        return primary, secondary
+
+    async def test_aevaluate_plan_matches_sync_result_shape(self):
+        """Test that async evaluations return the sync result structure."""
+        primary, secondary = self._make_judges()
+
+        primary_result = await primary.aevaluate_plan("PlanA", "content", "audit")
+        secondary_result = await secondary.aevaluate_plan(
+            "PlanA", "content", "audit", primary_evaluation="Primary"
+        )
+
+        self.assertTrue(primary_result["success"])
+        self.assertEqual(primary_result["evaluator"], "Primary Judge (Gemini Pro)")
+        self.assertEqual(primary_result["evaluation_content"], "Primary")
+        self.assertTrue(secondary_result["includes_primary_comparison"])
+        self.assertEqual(secondary_result["evaluation_content"], "Secondary")
+        primary.llm.invoke.assert_not_called()
+
+    async def test_aevaluate_plan_failure_returns_error_result(self):
+        """Test that async LLM errors produce the failed evaluation dict."""
+        primary, _ = self._make_judges()
+        primary.llm.ainvoke.side_effect = Exception("quota exceeded")
+
+        result = await primary.aevaluate_plan("PlanA", "content", "audit")
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["status"], "failed")
+        self.assertEqual(result["llm_type"], "gemini")
+
+    async def test_evaluate_plans_concurrently_orders_and_limits(self):
+        """Test judge-major ordering and the concurrency limit."""
+        primary, secondary = self._make_judges()
+        in_flight = 0
+        max_in_flight = 0
+
+        def slow_ainvoke(content):
+            async def _ainvoke(prompt):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return MagicMock(content=content)
+
+            return _ainvoke
+
+        primary.llm.ainvoke = slow_ainvoke("Primary")
+        secondary._llm.ainvoke = slow_ainvoke("Secondary")
+        plans = {"PlanA": "a", "PlanB": "b", "PlanC": "c"}
+
+        results = await evaluate_plans_concurrently(
+            [primary, secondary], plans, "audit", max_concurrency=2
+        )
+
+        self.assertEqual(
+            [(r["evaluation_content"], r["plan_name"]) for r in results],
+            [
+                ("Primary", "PlanA"),
+                ("Primary", "PlanB"),
+                ("Primary", "PlanC"),
+                ("Secondary", "PlanA"),
+                ("Secondary", "PlanB"),
+                ("Secondary", "PlanC"),
+            ],
+        )
+        self.assertEqual(max_in_flight, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
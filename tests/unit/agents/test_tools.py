@@ -7,7 +7,11 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
-from src.agents.tools.evaluation_framework import EvaluationFrameworkTool
+from src.agents.tools import shared_tool
+from src.agents.tools.evaluation_framework import (
+    EvaluationFrameworkTool,
+    _load_criteria,
+)
 from src.agents.tools.gap_analyzer import GapAnalyzerTool
 from src.agents.tools.plan_comparator import PlanComparatorTool
 from src.agents.tools.scoring_calculator import ScoringCalculatorTool
@@ -36,9 +40,39 @@ class TestEvaluationFrameworkTool(unittest.TestCase):
         self.assertIsInstance(result, str)
         self.assertIn("evaluation", result.lower())
 
+    def test_prompt_lists_weighted_criteria(self):
+        """Test that every criterion and its weight appear in the prompt"""
+        result = self.tool._run(
+            plan_name="Test Plan",
+            plan_content="Test plan content",
+            audit_context="Test audit context",
+        )
+
+        for criterion, weight in self.tool.criteria_weights.items():
+            self.assertIn(f"- {criterion} ({weight * 100:.0f}%)", result)
+
+    @patch("src.agents.tools.evaluation_framework.PromptManager")
+    def test_framework_prompt_parsed_once(self, mock_prompt_manager):
+        """Test that instances share one parse of the evaluation prompt"""
+        _load_criteria.cache_clear()
+        self.addCleanup(_load_criteria.cache_clear)
+        mock_prompt_manager.return_value.extract_evaluation_criteria.return_value = {
+            "Strategic": 1.0
+        }
+
+        first = EvaluationFrameworkTool()
+        second = EvaluationFrameworkTool()
+        first.criteria_weights["Strategic"] = 0.0
+
+        mock_prompt_manager.assert_called_once()
+        self.assertEqual(second.criteria_weights, {"Strategic": 1.0})
+
     @patch("src.agents.tools.evaluation_framework.PromptManager")
     def test_load_framework_criteria_success(self, mock_prompt_manager):
         """Test successful loading of framework criteria"""
+        _load_criteria.cache_clear()
+        self.addCleanup(_load_criteria.cache_clear)
+
         # Setup mock to return valid criteria
         mock_instance = Mock()
         mock_instance.extract_evaluation_criteria.return_value = {
@@ -58,6 +92,9 @@ class TestEvaluationFrameworkTool(unittest.TestCase):
     @patch("src.agents.tools.evaluation_framework.PromptManager")
     def test_load_framework_criteria_fallback(self, mock_prompt_manager):
         """Test fallback criteria when loading fails"""
+        _load_criteria.cache_clear()
+        self.addCleanup(_load_criteria.cache_clear)
+
         # Setup mock to raise exception
         mock_instance = Mock()
         mock_instance.extract_evaluation_criteria.side_effect = Exception("Load failed")
@@ -130,6 +167,27 @@ class TestGapAnalyzerTool(unittest.TestCase):
         gaps = self.tool._identify_wcag_gaps(plan_content, audit_content)
         self.assertIsInstance(gaps, dict)
 
+    def test_match_keywords_finds_overlapping_substrings(self):
+        """Test keyword matching is case-insensitive and substring based"""
+        hits = self.tool._match_keywords("Fix Color Contrast Ratio and ERRORS")
+
+        self.assertTrue(
+            {"color contrast", "contrast ratio", "contrast", "error"} <= hits
+        )
+        self.assertNotIn("keyboard", hits)
+
+    def test_extract_audit_issues_limits_and_filters_lines(self):
+        """Test issue extraction skips short lines and keeps the first 20"""
+        audit = "\n".join(
+            ["Short error", "   "]
+            + [f"  Violation {i}: Button has no accessible name  " for i in range(25)]
+        )
+
+        issues = self.tool._extract_audit_issues(audit)
+
+        self.assertEqual(len(issues), 20)
+        self.assertEqual(issues[0], "violation 0: button has no accessible name")
+
     def test_identify_strategic_gaps(self):
         """Test strategic gap identification"""
         coverage = {
@@ -215,5 +273,25 @@ class TestScoringCalculatorTool(unittest.TestCase):
         self.assertEqual(self.tool._assess_performance_level(4.0), "Needs Improvement")
 
 
+class TestSharedTool(unittest.TestCase):
+    """Test cases for sharing tool instances between agents"""
+
+    def test_shared_tool_returns_one_instance_per_class(self):
+        """Test that each tool class is only instantiated once"""
+        self.assertIs(shared_tool(GapAnalyzerTool), shared_tool(GapAnalyzerTool))
+        self.assertIsNot(shared_tool(GapAnalyzerTool), shared_tool(PlanComparatorTool))
+        self.assertIsInstance(shared_tool(ScoringCalculatorTool), ScoringCalculatorTool)
+
+    def test_agents_share_tool_instances(self):
+        """Test that judges reuse the same tool objects"""
+        from src.agents.judge_agent import PrimaryJudgeAgent, SecondaryJudgeAgent
+
+        primary = PrimaryJudgeAgent(MagicMock())
+        secondary = SecondaryJudgeAgent(MagicMock())
+
+        for primary_tool, secondary_tool in zip(primary.tools, secondary.tools):
+            self.assertIs(primary_tool, secondary_tool)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,8 @@ Following TDD approach:
 """
 
 import asyncio
+import json
+import statistics
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List
@@ -126,6 +128,37 @@ class TestBatchProcessor:
         assert "individual_results" in results
         assert "batch_summary" in results
 
+    @pytest.mark.asyncio
+    async def test_process_batch_job_runs_combinations_concurrently(self):
+        """Test combinations overlap up to the concurrency limit in audit order"""
+        job = BatchJob(
+            job_id="test_job_concurrent",
+            name="Concurrent Job",
+            audit_reports=[Path("audit1.pdf"), Path("audit2.pdf"), Path("audit3.pdf")],
+            plan_directories=[Path("plans/")],
+        )
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_process(audit_path, plan_dir, session_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"plan_scores": {"Plan A": 7.0}, "session_id": session_id}
+
+        with patch.object(
+            self.processor, "_process_audit_plan_combination", side_effect=slow_process
+        ):
+            results = await self.processor.process_batch_job(job)
+
+        # setup_method limits the processor to two concurrent evaluations
+        assert max_in_flight == 2
+        assert list(results["individual_results"]) == ["audit1", "audit2", "audit3"]
+        assert results["individual_results"]["audit3"]["session_id"] == "audit3_2"
+
     @pytest.mark.asyncio
     async def test_process_batch_job_failure(self):
         """Test batch job processing with error"""
@@ -263,6 +296,39 @@ class TestBatchProcessor:
         assert "consistency_metrics" in summary
         assert "recommendations" in summary
 
+    def test_generate_batch_summary_from_result_dicts(self):
+        """Test summary aggregates the dicts returned by combination processing"""
+        batch_results = {
+            "audit1": {"plan_scores": {"Plan A": 7.5, "Plan B": 6.0}},
+            "audit2": {"plan_scores": {"Plan A": 8.0, "Plan B": 7.0}},
+            "audit3": {"plan_scores": {"Plan A": 6.5}},
+        }
+
+        summary = self.processor._generate_batch_summary(batch_results)
+
+        plan_a = summary["average_scores"]["Plan A"]
+        assert plan_a["mean"] == pytest.approx(7.333333, rel=1e-6)
+        assert plan_a["min"] == 6.5
+        assert plan_a["max"] == 8.0
+        assert plan_a["std_dev"] == statistics.stdev([7.5, 8.0, 6.5])
+        assert summary["best_performing_plans"]["overall"]["plan"] == "Plan A"
+        assert summary["consistency_metrics"]["Plan A_consistency"] == 1.0 / (
+            1.0 + plan_a["std_dev"]
+        )
+
+    def test_generate_batch_summary_best_plan_keeps_first_on_tie(self):
+        """Test the best plan is the first plan with the highest mean"""
+        batch_results = {
+            "audit1": {"plan_scores": {"Plan A": 6.0, "Plan B": 8.0, "Plan C": 8.0}},
+        }
+
+        summary = self.processor._generate_batch_summary(batch_results)
+
+        assert summary["best_performing_plans"]["overall"] == {
+            "plan": "Plan B",
+            "average_score": 8.0,
+        }
+
     def test_calculate_std_dev(self):
         """Test standard deviation calculation"""
         scores = [7.0, 8.0, 6.0, 9.0, 7.5]
@@ -551,6 +617,96 @@ class TestBatchProcessorAdditionalCoverage:
         assert "Plan A**: 8.50" in result
         assert "Plan B**: 7.20" in result
 
+    def test_export_batch_results_json_encoding(self):
+        """Test JSON export of datetimes, non-ASCII text and special numbers"""
+        processor = BatchProcessor(Mock())
+
+        job = BatchJob(
+            job_id="json_job",
+            name="JSON Job",
+            audit_reports=[Path("audit.pdf")],
+            plan_directories=[Path("plans/")],
+            results={
+                "individual_results": {
+                    "audit": {"plan_scores": {"Plan É 🚀": 7.5, "Plan B": float("nan")}}
+                },
+                "batch_summary": {"generated_at": datetime(2025, 1, 1, 12, 0)},
+            },
+        )
+        processor.completed_jobs["json_job"] = job
+
+        exported = processor.export_batch_results("json_job", "json")
+
+        assert '"Plan É 🚀": 7.5' in exported
+        assert '"Plan B": null' in exported
+        assert '"generated_at": "2025-01-01 12:00:00"' in exported
+        assert json.loads(exported)["batch_summary"]["generated_at"] == (
+            "2025-01-01 12:00:00"
+        )
+
+    def test_export_batch_results_json_wide_integers(self):
+        """Test JSON export falls back to the stdlib encoder for wide integers"""
+        processor = BatchProcessor(Mock())
+
+        job = BatchJob(
+            job_id="wide_int_job",
+            name="Wide Int Job",
+            audit_reports=[Path("audit.pdf")],
+            plan_directories=[Path("plans/")],
+            results={"batch_summary": {"tokens": 2**70, "plan": "Plan É"}},
+        )
+        processor.completed_jobs["wide_int_job"] = job
+
+        exported = processor.export_batch_results("wide_int_job", "json")
+
+        assert json.loads(exported) == {
+            "batch_summary": {"tokens": 2**70, "plan": "Plan É"}
+        }
+        assert '"plan": "Plan É"' in exported
+
+    def test_export_batch_results_multi(self):
+        """Test exporting several formats in one call"""
+        processor = BatchProcessor(Mock())
+
+        job = BatchJob(
+            job_id="multi_job",
+            name="Multi Export Job",
+            audit_reports=[Path("audit.pdf")],
+            plan_directories=[Path("plans/")],
+        )
+        job.results = {
+            "batch_summary": {"total_evaluations": 1, "average_scores": {}},
+            "individual_results": {},
+        }
+        processor.completed_jobs["multi_job"] = job
+
+        exports = processor.export_batch_results_multi(
+            "multi_job", ["json", "csv", "markdown"]
+        )
+
+        assert list(exports) == ["json", "csv", "markdown"]
+        for format, output in exports.items():
+            assert output == processor.export_batch_results("multi_job", format)
+
+    def test_export_batch_results_multi_errors(self):
+        """Test multi-format export rejects missing jobs and bad formats"""
+        processor = BatchProcessor(Mock())
+
+        with pytest.raises(ValueError, match="No completed results"):
+            processor.export_batch_results_multi("missing_job", ["json"])
+
+        job = BatchJob(
+            job_id="multi_job",
+            name="Multi Export Job",
+            audit_reports=[Path("audit.pdf")],
+            plan_directories=[Path("plans/")],
+            results={"test": "data"},
+        )
+        processor.completed_jobs["multi_job"] = job
+
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            processor.export_batch_results_multi("multi_job", ["json", "xml"])
+
     def test_export_batch_results_csv_with_plan_scores(self):
         """Test CSV export with plan scores"""
         processor = BatchProcessor(Mock())
@@ -777,6 +933,29 @@ class TestAdditionalEdgeCases:
         assert isinstance(result, float)
         assert 1.0 <= result <= 2.0
 
+    def test_export_csv_quotes_fields_from_result_dicts(self):
+        """Test CSV export reads result dicts and quotes embedded commas"""
+        processor = BatchProcessor(Mock())
+
+        job = BatchJob(
+            job_id="test_job",
+            name="Test Job",
+            audit_reports=[Path("audit.pdf")],
+            plan_directories=[Path("plans/")],
+        )
+        job.results = {
+            "individual_results": {
+                "audit1": {"plan_scores": {"Plan A, revised": 8.5, "Plan B": 7.2}}
+            }
+        }
+        processor.completed_jobs["test_job"] = job
+
+        result = processor.export_batch_results("test_job", "csv")
+
+        assert result == (
+            'Plan,Score,Audit\n"Plan A, revised",8.5,audit1\nPlan B,7.2,audit1\n'
+        )
+
     def test_export_csv_with_no_plan_scores(self):
         """Test CSV export when audit result has no plan_scores attribute"""
         processor = BatchProcessor(Mock())
@@ -498,6 +498,25 @@ class TestAccessibilityEvaluationCrew:
             assert "**Status:** NA" in item
             assert "No evaluation agents available" in item
 
+    def test_create_sample_evaluations_reuses_cached_samples(
+        self, mock_llm_manager, sample_evaluation_input
+    ):
+        """Test cached sample evaluations are handed out as independent copies"""
+        # Arrange
+        crew = AccessibilityEvaluationCrew(mock_llm_manager)
+
+        # Act
+        first = crew._create_sample_evaluations(sample_evaluation_input)
+        first[0].scores[0].score = 0.0
+        first[0].pros.append("Mutated by caller")
+        second = crew._create_sample_evaluations(sample_evaluation_input)
+
+        # Assert
+        assert len(second) == 4  # Two judges for each of the two plans
+        assert [e.plan_name for e in second] == [e.plan_name for e in first]
+        assert second[0].scores[0].score == 8.0
+        assert "Mutated by caller" not in second[0].pros
+
     @patch("src.config.crew_config.Crew")
     def test_execute_complete_evaluation_with_resilience(
         self,
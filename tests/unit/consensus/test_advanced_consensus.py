@@ -8,6 +8,7 @@ Following TDD approach:
 3. Refactor and improve
 """
 
+from dataclasses import FrozenInstanceError
 from typing import Dict, List
 from unittest.mock import Mock, patch
 
@@ -59,6 +60,24 @@ class TestConflictAnalysis:
         assert conflict.severity == ConflictSeverity.MEDIUM
         assert conflict.confidence_delta == 0.2
 
+    def test_conflict_analysis_is_immutable(self):
+        """Test conflict analyses cannot be modified after creation"""
+        conflict = ConflictAnalysis(
+            plan_name="Plan A",
+            criterion="Strategic Prioritization",
+            primary_score=7.5,
+            secondary_score=6.0,
+            difference=1.5,
+            severity=ConflictSeverity.HIGH,
+            primary_rationale="",
+            secondary_rationale="",
+            confidence_delta=0.0,
+        )
+
+        assert not hasattr(conflict, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            conflict.severity = ConflictSeverity.LOW
+
 
 class TestAdvancedConsensusEngine:
     """Test Advanced Consensus Engine functionality"""
@@ -147,6 +166,63 @@ class TestAdvancedConsensusEngine:
             assert hasattr(conflict, "criterion")
             assert hasattr(conflict, "severity")
 
+    def test_classify_severities_boundaries(self):
+        """Test severity thresholds keep their strict and inclusive bounds"""
+        differences = np.array([0.49, 0.5, 1.0, 1.01, 2.0, 2.01])
+
+        severities = self.engine._classify_severities(differences)
+
+        assert severities == [
+            ConflictSeverity.LOW,
+            ConflictSeverity.MEDIUM,
+            ConflictSeverity.MEDIUM,
+            ConflictSeverity.HIGH,
+            ConflictSeverity.HIGH,
+            ConflictSeverity.CRITICAL,
+        ]
+
+    def test_analyze_conflicts_across_multiple_plans(self):
+        """Test conflicts from several plans keep their order and plan names"""
+
+        def make_evaluation(plan_name, judge_id, scores):
+            evaluation = Mock(spec=PlanEvaluation)
+            evaluation.plan_name = plan_name
+            evaluation.judge_id = judge_id
+            evaluation.judgment_scores = [
+                Mock(criterion=criterion, score=score, rationale=f"{judge_id} view")
+                for criterion, score in scores
+            ]
+            return evaluation
+
+        evaluations = [
+            make_evaluation(
+                "Plan A", "gemini", [("Strategy", 7.0), ("Technical", 6.0)]
+            ),
+            make_evaluation(
+                "Plan B", "gemini", [("Strategy", 9.0), ("Technical", 5.0)]
+            ),
+            make_evaluation("Plan A", "gpt4", [("Technical", 6.3), ("Strategy", 4.5)]),
+            make_evaluation("Plan B", "gpt4", [("Strategy", 8.2), ("Technical", 6.5)]),
+        ]
+
+        conflicts = self.engine.analyze_conflicts(evaluations)
+
+        assert [(c.plan_name, c.criterion) for c in conflicts] == [
+            ("Plan A", "Strategy"),
+            ("Plan A", "Technical"),
+            ("Plan B", "Strategy"),
+            ("Plan B", "Technical"),
+        ]
+        assert [c.difference for c in conflicts] == pytest.approx([2.5, 0.3, 0.8, 1.5])
+        assert [c.severity for c in conflicts] == [
+            ConflictSeverity.CRITICAL,
+            ConflictSeverity.LOW,
+            ConflictSeverity.MEDIUM,
+            ConflictSeverity.HIGH,
+        ]
+        assert conflicts[2].primary_score == 9.0
+        assert conflicts[2].secondary_score == 8.2
+
     def test_resolve_conflicts_returns_scores(self):
         """Test that resolve_conflicts returns resolved scores"""
         # Create sample conflicts
@@ -245,6 +321,23 @@ class TestAdvancedConsensusEngine:
         examples_score = self.engine._score_evidence_quality(examples_rationale)
         assert examples_score > 0
 
+    def test_evidence_quality_indicator_weights(self):
+        """Test each indicator group counts once and matches substrings"""
+        # One hit per group regardless of how many of its phrases appear
+        assert self.engine._score_evidence_quality(
+            "WCAG guideline Level AA"
+        ) == pytest.approx(0.2)
+        # Phrases match inside longer words, e.g. "code" in "Barcode"
+        assert self.engine._score_evidence_quality("Barcode") == pytest.approx(0.2)
+        # Quantitative data needs both a unit and a digit
+        assert self.engine._score_evidence_quality("Contrast ratio") == 0.0
+        assert self.engine._score_evidence_quality(
+            "Contrast ratio of 4.5"
+        ) == pytest.approx(0.15)
+        assert self.engine._score_evidence_quality(
+            "For example, the user sees aria code at level A in 3 seconds"
+        ) == pytest.approx(1.0)
+
     def test_expert_mediation_resolution(self):
         """Test expert mediation for high severity conflicts"""
         conflict = ConflictAnalysis(
@@ -8,6 +8,7 @@ Following TDD approach:
 3. Refactor and improve
 """
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
 from unittest.mock import Mock, patch
@@ -49,6 +50,14 @@ class TestPerformanceMetrics:
         assert metrics.api_calls_made == 25
         assert metrics.cache_hit_rate == 0.85
 
+    def test_performance_metrics_are_slotted_and_immutable(self):
+        """Test recorded metrics cannot be modified after creation"""
+        metrics = PerformanceMetrics(datetime.now(), 1000, 50, 1000, 1, 0, 100, 10, 0.7)
+
+        assert not hasattr(metrics, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            metrics.memory_usage_mb = 2000
+
 
 class TestPerformanceMonitor:
     """Test Performance Monitor functionality"""
@@ -124,6 +133,35 @@ class TestPerformanceMonitor:
         assert metrics.response_time_ms == 0
         assert metrics.active_agents == 0
 
+    @patch("src.monitoring.performance_monitor.psutil")
+    def test_record_metrics_batch_samples_system_once(self, mock_psutil):
+        """Test batch recording shares a single psutil sample"""
+        mock_psutil.virtual_memory.return_value.used = 1024 * 1024 * 1024  # 1GB
+        mock_psutil.cpu_percent.return_value = 30.0
+
+        batch = self.monitor.record_metrics_batch(
+            [
+                {"active_agents": 2, "tokens_processed": 500},
+                {"response_time_ms": 2500},
+                {},
+            ]
+        )
+
+        assert mock_psutil.virtual_memory.call_count == 1
+        assert mock_psutil.cpu_percent.call_count == 1
+        assert len(batch) == 3
+        assert self.monitor.metrics_history == batch
+        assert all(m.memory_usage_mb == 1024.0 for m in batch)
+        assert batch[0].active_agents == 2
+        assert batch[1].response_time_ms == 2500
+        assert batch[2].tokens_processed == 0
+
+    @patch("src.monitoring.performance_monitor.psutil")
+    def test_record_metrics_batch_empty(self, mock_psutil):
+        """Test batch recording with no entries skips sampling"""
+        assert self.monitor.record_metrics_batch([]) == []
+        mock_psutil.cpu_percent.assert_not_called()
+
     @patch("src.monitoring.performance_monitor.psutil")
     def test_performance_threshold_warnings(self, mock_psutil):
         """Test that performance threshold violations generate warnings"""
@@ -237,6 +275,21 @@ class TestPerformanceMonitor:
         assert analysis["peak_mb"] == 2000.0
         assert analysis["min_mb"] == 1000.0
 
+    def test_analyze_cpu_usage(self):
+        """Test CPU usage analysis"""
+        metrics = [
+            PerformanceMetrics(datetime.now(), 1000, 50, 1000, 1, 0, 100, 10, 0.7),
+            PerformanceMetrics(datetime.now(), 1500, 65, 1500, 2, 1, 150, 15, 0.75),
+            PerformanceMetrics(datetime.now(), 2000, 35.5, 2000, 3, 2, 200, 20, 0.8),
+        ]
+
+        analysis = self.monitor._analyze_cpu_usage(metrics)
+
+        assert analysis["average_percent"] == pytest.approx(50.1666667)
+        assert analysis["peak_percent"] == 65.0
+        assert analysis["min_percent"] == 35.5
+        assert all(isinstance(value, float) for value in analysis.values())
+
     def test_generate_optimization_recommendations(self):
         """Test optimization recommendations generation"""
         # Create metrics that trigger various recommendations
@@ -332,7 +385,7 @@ class TestCacheManager:
         )
 
         assert isinstance(key1, str)
-        assert len(key1) == 64  # SHA256 hash length
+        assert len(key1) == 64  # 32-byte BLAKE2b digest
         assert key1 == key2  # Same inputs should produce same key
         assert key1 != key3  # Different inputs should produce different keys
 
@@ -3,6 +3,7 @@ Test-Driven Development for PDF parsing functionality
 Red-Green-Refactor cycle implementation
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -115,8 +116,10 @@ class TestPDFParserTDD:
 
         parser = PDFParser()
 
-        # Mock directory with plan files
-        with patch("pathlib.Path.glob") as mock_glob:
+        # Mock directory with plan files; parse in-process so the mocks apply
+        with patch("pathlib.Path.glob") as mock_glob, patch(
+            "src.tools.pdf_parser.ProcessPoolExecutor", ThreadPoolExecutor
+        ):
             mock_glob.return_value = [Path("PlanA.pdf"), Path("PlanB.pdf")]
 
             with patch.object(parser, "_validate_file"):
@@ -228,12 +231,29 @@ class TestPDFParserIntegration:
             with pytest.raises(ValueError, match="Failed to parse remediation plan"):
                 parser.parse_remediation_plan(Path("test.pdf"))
 
+    def test_batch_parse_plans_in_worker_processes(self, tmp_path):
+        """Test plans are parsed in worker processes from real PDF files"""
+        canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+
+        for plan_letter in ("A", "B"):
+            pdf = canvas.Canvas(str(tmp_path / f"Plan{plan_letter}.pdf"))
+            pdf.drawString(72, 720, f"Remediation steps for plan {plan_letter}")
+            pdf.save()
+
+        plans = PDFParser().batch_parse_plans(tmp_path)
+
+        assert sorted(plans) == ["PlanA", "PlanB"]
+        assert plans["PlanA"].title == "Remediation Plan PlanA"
+        assert "plan B" in plans["PlanB"].content
+
     def test_batch_parse_plans_with_invalid_files(self):
         """Test batch parsing with mix of valid and invalid files"""
         parser = PDFParser()
 
-        # Mock directory with some files
-        with patch("pathlib.Path.glob") as mock_glob:
+        # Mock directory with some files; parse in-process so the mocks apply
+        with patch("pathlib.Path.glob") as mock_glob, patch(
+            "src.tools.pdf_parser.ProcessPoolExecutor", ThreadPoolExecutor
+        ):
             mock_files = [Path("PlanA.pdf"), Path("PlanB.pdf")]
             mock_glob.return_value = mock_files
 
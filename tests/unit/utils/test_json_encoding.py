@@ -0,0 +1,45 @@
+"""
+Unit tests for the shared JSON export encoder.
+
+References:
+    - Master Plan: Testing standards and patterns
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.utils.json_encoding import dumps_json_bytes
+
+
+@dataclass
+class SamplePlan:
+    """Small dataclass used to check default=str passthrough"""
+
+    name: str
+
+
+class TestDumpsJsonBytes:
+    """Test suite for dumps_json_bytes"""
+
+    def test_indents_and_stringifies_unsupported_values(self):
+        """Test datetimes and dataclasses are written via str()"""
+        encoded = dumps_json_bytes(
+            {"generated_at": datetime(2025, 1, 1, 12, 0), "plan": SamplePlan("A")}
+        )
+
+        assert encoded.startswith(b'{\n  "generated_at": "2025-01-01 12:00:00"')
+        assert json.loads(encoded)["plan"] == "SamplePlan(name='A')"
+
+    def test_writes_non_ascii_unescaped_and_nan_as_null(self):
+        """Test emoji stay raw UTF-8 and NaN becomes null"""
+        encoded = dumps_json_bytes({"Plan É 🚀": float("nan")})
+
+        assert encoded == '{\n  "Plan É 🚀": null\n}'.encode("utf-8")
+
+    def test_falls_back_to_stdlib_for_wide_integers(self):
+        """Test integers wider than 64 bits are still encoded"""
+        encoded = dumps_json_bytes({"tokens": 2**70, "plan": "Plan É"})
+
+        assert json.loads(encoded) == {"tokens": 2**70, "plan": "Plan É"}
+        assert '"plan": "Plan É"'.encode("utf-8") in encoded
@@ -0,0 +1,21 @@
+"""
+Unit tests for the result timestamp helper.
+
+References:
+    - Master Plan: Testing standards and patterns
+"""
+
+from datetime import datetime
+
+from src.utils.timestamps import now_timestamp
+
+
+class TestNowTimestamp:
+    """Tests for now_timestamp"""
+
+    def test_matches_strftime_format(self):
+        """Timestamps keep the YYYY-MM-DD HH:MM:SS format used in results"""
+        timestamp = now_timestamp()
+
+        parsed = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+        assert parsed.strftime("%Y-%m-%d %H:%M:%S") == timestamp